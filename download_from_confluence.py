@@ -1,12 +1,14 @@
 import requests
 import os
+import re
+import shutil
+from collections import deque
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from urllib3.exceptions import InsecureRequestWarning
 from urllib.parse import urljoin
 from dotenv import load_dotenv
 
-# Suppress SSL warnings
-requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
-
 # Load environment variables from .env file
 load_dotenv()
 
@@ -20,10 +22,29 @@ OUTPUT_DIR = os.getenv('CONFLUENCE_OUTPUT_DIR', './pdfs')
 ATTACHMENTS_DIR = os.getenv('CONFLUENCE_ATTACHMENTS_DIR', './attachments')
 VERIFY_SSL = os.getenv('CONFLUENCE_VERIFY_SSL', 'true').lower() == 'true'
 
+# Any character that is not alphanumeric or "_" (same rule as str.isalnum) is replaced in file names
+UNSAFE_TITLE_CHARS = re.compile(r"\W")
+
+# Suppress SSL warnings only when verification is deliberately disabled
+if not VERIFY_SSL:
+    requests.packages.urllib3.disable_warnings(category=InsecureRequestWarning)
+
+# One pooled session for all requests so connections and TLS handshakes are reused
+SESSION = requests.Session()
+SESSION.auth = (USERNAME, PASSWORD)
+SESSION.verify = VERIFY_SSL
+ADAPTER = HTTPAdapter(
+    pool_connections=16,
+    pool_maxsize=32,
+    # Once retries run out, return the last response so a failing page is reported and skipped
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+)
+SESSION.mount("https://", ADAPTER)
+SESSION.mount("http://", ADAPTER)
+
 def get_parent_page_id(page_title):
-    response = requests.get(
+    response = SESSION.get(
         f"{CONFLUENCE_URL}/rest/api/content",
-        auth=(USERNAME, PASSWORD),
         params={
             "spaceKey": SPACE_KEY,
             "title": page_title,
@@ -49,63 +70,94 @@ def get_parent_page_id(page_title):
 
 
 def get_children_recursive(parent_id):
-    """Recursively fetch all child pages under a parent"""
+    """Fetch all child pages under a parent, walking the tree breadth-first"""
     all_pages = []
-    start = 0
     limit = 100  # Confluence's max per request
+    queue = deque([parent_id])
 
-    while True:
-        url = urljoin(CONFLUENCE_URL, f"/rest/api/content/{parent_id}/child/page")
-        params = {
-            "limit": limit,
-            "start": start,
-            "expand": "children.page"
-        }
+    # Iterative walk so deep spaces can't hit Python's recursion limit
+    while queue:
+        page_id = queue.popleft()
+        start = 0
+
+        while True:
+            url = urljoin(CONFLUENCE_URL, f"/rest/api/content/{page_id}/child/page")
+            params = {
+                "limit": limit,
+                "start": start,
+                "expand": "children.page"
+            }
+
+            response = SESSION.get(url, params=params)
 
-        response = requests.get(
-            url,
-            auth=(USERNAME, PASSWORD),
-            params=params,
-            verify=VERIFY_SSL
-        )
+            if response.status_code != 200:
+                print(f"Error: {response.status_code}")
+                break
+
+            data = response.json()
+            children = data["results"]
+            all_pages.extend(children)
+
+            # Queue grandchildren, skipping pages the expansion reports as leaves
+            queue.extend(
+                child["id"] for child in children
+                if child.get("children", {}).get("page", {}).get("size", 1) > 0
+            )
+
+            if data["size"] < limit:
+                break
+
+            start += limit
+
+    return all_pages
+
+def get_descendants(ancestor_id):
+    """Fetch all descendant pages with a paginated CQL search, falling back to recursion"""
+    all_pages = []
+    url = urljoin(CONFLUENCE_URL, "/rest/api/content/search")
+    params = {
+        "cql": f'ancestor="{ancestor_id}" and type=page',
+        "limit": "200"
+    }
+
+    # Follow the _links.next cursor: the server may cap the window below the requested limit
+    while True:
+        response = SESSION.get(url, params=params)
 
         if response.status_code != 200:
-            print(f"Error: {response.status_code}")
-            break
+            print(f"CQL search failed ({response.status_code}), falling back to recursive listing")
+            return get_children_recursive(ancestor_id)
 
         data = response.json()
-        children = data["results"]
-        all_pages.extend(children)
-
-        # Recursively fetch grandchildren
-        for child in children:
-            all_pages.extend(get_children_recursive(child["id"]))
+        all_pages.extend(data["results"])
 
-        if data["size"] < limit:
+        links = data.get("_links", {})
+        next_link = links.get("next")
+        if not next_link:
             break
 
-        start += limit
+        url = (links.get("base") or CONFLUENCE_URL).rstrip("/") + next_link
+        params = {}  # The next link already carries the query
 
     return all_pages
 
 def export_pdf_and_attachments(page_id, title):
-    safe_title = "".join(c if c.isalnum() or c == '_' else '_' for c in title).rstrip('_')
+    safe_title = UNSAFE_TITLE_CHARS.sub("_", title).rstrip('_')
 
     # Export PDF
     pdf_url = urljoin(CONFLUENCE_URL, f"/spaces/flyingpdf/pdfpageexport.action?pageId={page_id}")
-    pdf_response = requests.get(pdf_url, auth=(USERNAME, PASSWORD), stream=True, verify=VERIFY_SSL)
-
-    if pdf_response.status_code == 200:
-        with open(f"{OUTPUT_DIR}/{safe_title}.pdf", "wb") as f:
-            for chunk in pdf_response.iter_content(chunk_size=8192):
-                f.write(chunk)
-        print(f"Exported PDF: {safe_title}.pdf")
-    else:
-        print(f"Failed to export PDF {title}: {pdf_response.status_code}")
+    with SESSION.get(pdf_url, stream=True) as pdf_response:
+        if pdf_response.status_code == 200:
+            with open(os.path.join(OUTPUT_DIR, f"{safe_title}.pdf"), "wb", buffering=1 << 20) as f:
+                pdf_response.raw.decode_content = True
+                shutil.copyfileobj(pdf_response.raw, f, length=1 << 20)
+            print(f"Exported PDF: {safe_title}.pdf")
+        else:
+            print(f"Failed to export PDF {title}: {pdf_response.status_code}")
 
     # Get attachments using proper API endpoint
     attachments_url = urljoin(CONFLUENCE_URL, f"/rest/api/content/{page_id}/child/attachment")
-    attachments_response = requests.get(attachments_url, auth=(USERNAME, PASSWORD), verify=VERIFY_SSL)
+    attachments_response = SESSION.get(attachments_url)
 
     if attachments_response.status_code == 200:
         attachments = attachments_response.json()["results"]
@@ -113,15 +165,15 @@ def export_pdf_and_attachments(page_id, title):
             # Use the download link from the attachment metadata
             download_url = urljoin(CONFLUENCE_URL, attachment["_links"]["download"])
 
-            attachment_response = requests.get(download_url, auth=(USERNAME, PASSWORD), stream=True, verify=VERIFY_SSL)
-            if attachment_response.status_code == 200:
-                attachment_filename = f"{safe_title}_{attachment['title']}"
-                with open(f"{ATTACHMENTS_DIR}/{attachment_filename}", "wb") as f:
-                    for chunk in attachment_response.iter_content(chunk_size=8192):
-                        f.write(chunk)
-                print(f"Downloaded attachment: {attachment_filename}")
-            else:
-                print(f"Failed to download attachment: {download_url} - {attachment_response.status_code}")
+            with SESSION.get(download_url, stream=True) as attachment_response:
+                if attachment_response.status_code == 200:
+                    attachment_filename = f"{safe_title}_{attachment['title']}"
+                    with open(os.path.join(ATTACHMENTS_DIR, attachment_filename), "wb", buffering=1 << 20) as f:
+                        attachment_response.raw.decode_content = True
+                        shutil.copyfileobj(attachment_response.raw, f, length=1 << 20)
+                    print(f"Downloaded attachment: {attachment_filename}")
+                else:
+                    print(f"Failed to download attachment: {download_url} - {attachment_response.status_code}")
     else:
         print(f"Failed to fetch attachments for {title}: {attachments_response.status_code}")
 
@@ -134,7 +186,7 @@ if __name__ == "__main__":
         print(f"Could not find parent page: {PARENT_PAGE_TITLE}")
         exit(1)
     
-    all_pages = get_children_recursive(parent_page_id)
+    all_pages = get_descendants(parent_page_id)
     print(f"Found {len(all_pages)} pages. Starting export...")
 
     for page in all_pages:
@@ -4,23 +4,50 @@ Unified entry point for Confluence downloading and PDF-to-Markdown conversion.
 Supports independent operations and chained workflows.
 """
 
+import logging
 import os
 import sys
 from pathlib import Path
 from typing import Optional
 
 import click
-from dotenv import load_dotenv
 
 from modules.downloader import ConfluenceDownloader
 from modules.pdf_converter.converter import PDFToMarkdownConverter, PDFConversionError
 from modules.pdf_converter.config import load_config, setup_logging
 
+logger = logging.getLogger(__name__)
+
+DEFAULT_CONFLUENCE_MAX_WORKERS = 8
+
+
+def _confluence_max_workers() -> int:
+    """Read CONFLUENCE_MAX_WORKERS, falling back to the default for invalid values
+
+    Returns:
+        Number of concurrent page exports (at least 1)
+    """
+    value = os.getenv('CONFLUENCE_MAX_WORKERS')
+    if value is None:
+        return DEFAULT_CONFLUENCE_MAX_WORKERS
+    try:
+        max_workers = int(value)
+    except ValueError:
+        max_workers = 0
+    if max_workers < 1:
+        logger.warning(
+            f"Invalid CONFLUENCE_MAX_WORKERS value {value!r} (must be an integer >= 1), "
+            f"using {DEFAULT_CONFLUENCE_MAX_WORKERS}"
+        )
+        return DEFAULT_CONFLUENCE_MAX_WORKERS
+    return max_workers
+
 
 def load_confluence_config() -> dict:
-    """Load Confluence configuration from environment variables"""
-    load_dotenv()
-    
+    """Load Confluence configuration from environment variables
+
+    The .env file is loaded once, when modules.pdf_converter.config is imported.
+    """
     return {
         'url': os.getenv('CONFLUENCE_URL', 'https://confluence.example.com'),
         'username': os.getenv('CONFLUENCE_USERNAME', 'admin'),
@@ -29,15 +56,17 @@ def load_confluence_config() -> dict:
         'parent_page_title': os.getenv('CONFLUENCE_PARENT_PAGE_TITLE', 'Root Page'),
         'output_dir': os.getenv('CONFLUENCE_OUTPUT_DIR', './output/pdfs'),
         'attachments_dir': os.getenv('CONFLUENCE_ATTACHMENTS_DIR', './output/attachments'),
-        'verify_ssl': os.getenv('CONFLUENCE_VERIFY_SSL', 'true').lower() == 'true'
+        'verify_ssl': os.getenv('CONFLUENCE_VERIFY_SSL', 'true').lower() == 'true',
+        'max_workers': _confluence_max_workers()
     }
 
 
 @click.group()
 @click.option("--verbose", "-v", is_flag=True, help="Enable verbose logging")
 @click.option("--cpu-only", is_flag=True, help="Force CPU-only processing for PDF conversion")
+@click.option("--buffer-logs", is_flag=True, help="Buffer console log output and write it in batches (errors immediately)")
 @click.pass_context
-def cli(ctx, verbose, cpu_only):
+def cli(ctx, verbose, cpu_only, buffer_logs):
     """Confluence to Markdown Converter
     
     Download PDFs from Confluence and/or convert them to clean Markdown.
@@ -53,7 +82,7 @@ def cli(ctx, verbose, cpu_only):
     
     # Setup logging
     log_level = "DEBUG" if verbose else ctx.obj['pdf_config'].get("converter", {}).get("log_level", "INFO")
-    setup_logging(log_level)
+    setup_logging(log_level, buffered=buffer_logs)
 
 
 @cli.command()
@@ -93,7 +122,8 @@ def download(ctx, parent_page, space, output_dir, attachments_dir):
             space_key=config['space_key'],
             output_dir=config['output_dir'],
             attachments_dir=config['attachments_dir'],
-            verify_ssl=config['verify_ssl']
+            verify_ssl=config['verify_ssl'],
+            max_workers=config['max_workers']
         )
         
         # Download PDFs
@@ -115,8 +145,9 @@ def download(ctx, parent_page, space, output_dir, attachments_dir):
 @click.argument("pdf_source", required=False)
 @click.option("--output-dir", "-o", help="Override output directory from .env")
 @click.option("--pattern", "-p", default="*.pdf", help="PDF file pattern for directory conversion")
+@click.option("--workers", "-w", default=1, type=int, help="Worker processes for CPU batch conversion (each loads its own models)")
 @click.pass_context
-def convert(ctx, pdf_source, output_dir, pattern):
+def convert(ctx, pdf_source, output_dir, pattern, workers):
     """Convert PDFs to Markdown
     
     PDF_SOURCE can be:
@@ -185,7 +216,7 @@ def convert(ctx, pdf_source, output_dir, pattern):
             
             click.echo(f"📊 Found {len(pdf_files)} PDF files to convert")
             
-            results = converter.batch_convert(pdf_files, output_dir_path)
+            results = converter.batch_convert(pdf_files, output_dir_path, max_workers=workers)
             
             click.echo("✅ Batch conversion completed!")
             click.echo(f"📈 Success: {len(results['success'])} files")
@@ -253,7 +284,8 @@ def workflow(ctx, parent_page, space, confluence_output, attachments_dir, markdo
             space_key=confluence_config['space_key'],
             output_dir=confluence_config['output_dir'],
             attachments_dir=confluence_config['attachments_dir'],
-            verify_ssl=confluence_config['verify_ssl']
+            verify_ssl=confluence_config['verify_ssl'],
+            max_workers=confluence_config['max_workers']
         )
         
         success = downloader.run(confluence_config['parent_page_title'])
@@ -339,6 +371,7 @@ def info(ctx):
     click.echo(f"PDF Output: {confluence_config['output_dir']}")
     click.echo(f"Attachments Output: {confluence_config['attachments_dir']}")
     click.echo(f"SSL Verification: {'✅ Enabled' if confluence_config['verify_ssl'] else '❌ Disabled'}")
+    click.echo(f"Download Workers: {confluence_config['max_workers']}")
     
     click.echo("\n📄 PDF CONVERTER SETTINGS:")
     converter_config = pdf_config.get("converter", {})
@@ -386,6 +419,9 @@ def info(ctx):
                 click.echo(f"Primary GPU: {torch.cuda.get_device_name(0)}")
             else:
                 click.echo(f"CUDA available: ❌ No")
+            mps_backend = getattr(torch.backends, "mps", None)
+            if mps_backend is not None and mps_backend.is_available():
+                click.echo(f"MPS available: ✅ Yes")
         except ImportError:
             click.echo(f"PyTorch: ❌ Not installed")
             
@@ -1,20 +1,73 @@
 import requests
+import hashlib
+import json
 import os
 import logging
+import re
+import shutil
+import tempfile
+import threading
+from collections import Counter
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from pathlib import Path
+from requests.adapters import HTTPAdapter
 from urllib3.exceptions import InsecureRequestWarning
+from urllib3.util.retry import Retry
 from urllib.parse import urljoin
 from typing import List, Dict, Any, Optional, Tuple
 import urllib3
 
-# Suppress SSL warnings (same as original)
-urllib3.disable_warnings(category=InsecureRequestWarning)
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
 
 logger = logging.getLogger(__name__)
 
+# Any character that is not alphanumeric or "_" (same rule as str.isalnum) is replaced in file names
+_UNSAFE_TITLE_CHARS = re.compile(r"\W")
+
+# Attachment file extensions counted as images
+_IMAGE_EXTENSIONS = (".png", ".jpg", ".jpeg", ".gif", ".svg")
+
 
 class ConfluenceDownloader:
     """Confluence downloader with comprehensive metadata tracking and statistics"""
 
+    # Connection pool sizing for the shared HTTP session (raised to cover max_workers if needed)
+    POOL_CONNECTIONS = 32
+    POOL_MAXSIZE = 64
+
+    # Default number of pages exported concurrently
+    MAX_WORKERS = 8
+
+    # Attachments downloaded concurrently, shared by all pages being exported
+    ATTACHMENT_WORKERS = 4
+
+    # Results requested per window on paginated endpoints
+    PAGE_LIMIT = 200
+
+    # Expansion that returns attachment metadata together with each listed page
+    ATTACHMENT_EXPAND = "children.attachment,children.attachment.version"
+
+    # Expansion for page listings: page version plus attachment metadata
+    PAGE_EXPAND = f"version,{ATTACHMENT_EXPAND}"
+
+    # File in output_dir recording the version of every exported page
+    PAGE_CACHE_FILE = ".confluence_cache.json"
+
+    # Read/write buffer size for streamed PDF and attachment downloads
+    DOWNLOAD_CHUNK = 1 << 20
+
+    # Downloads at least this large have their disk space preallocated
+    PREALLOCATE_MIN_SIZE = 1 << 20
+
+    # Suffix of the JSON sidecar recording the version/ETag of each downloaded attachment
+    META_SUFFIX = ".meta.json"
+
     def __init__(
         self,
         confluence_url: str,
@@ -24,6 +77,7 @@ class ConfluenceDownloader:
         output_dir: str,
         attachments_dir: Optional[str] = None,
         verify_ssl: bool = True,
+        max_workers: Optional[int] = None,
     ) -> None:
         """Initialize the Confluence downloader
 
@@ -35,6 +89,7 @@ class ConfluenceDownloader:
             output_dir: Directory for PDF exports
             attachments_dir: Directory for attachments (defaults to output_dir)
             verify_ssl: Whether to verify SSL certificates
+            max_workers: Number of pages exported concurrently (defaults to MAX_WORKERS)
         """
         self.confluence_url = confluence_url
         self.username = username
@@ -43,29 +98,122 @@ class ConfluenceDownloader:
         self.output_dir = output_dir
         # If no separate attachments directory is provided, use output_dir for backward compatibility
         self.attachments_dir = attachments_dir or output_dir
+        self.output_root = Path(self.output_dir)
+        self.attachments_root = Path(self.attachments_dir)
         self.verify_ssl = verify_ssl
+        if not verify_ssl:
+            # Only silence certificate warnings when verification is deliberately disabled
+            urllib3.disable_warnings(category=InsecureRequestWarning)
+
+        self.max_workers = max_workers or self.MAX_WORKERS
 
-        # Metadata tracking (always enabled)
+        # Metadata tracking (always enabled), shared by the export worker threads
+        self._metadata_lock = threading.Lock()
         self.page_metadata: Dict[str, Dict] = {}  # page_id -> metadata
         self.attachment_metadata: Dict[str, List[Dict]] = {}  # page_id -> attachments
         self.downloaded_attachments: Dict[str, List[str]] = {}  # page_title -> filenames
 
+        # Attachment deduplication by content hash
+        self._attachment_path_by_sha: Dict[str, Path] = {}  # sha256 -> first saved path
+        self._attachment_sha_by_id: Dict[str, str] = {}  # attachment id@version -> sha256
+        self._dedupe_lock = threading.Lock()
+
+        # Shared HTTP session so connections (and TLS handshakes) are reused across requests
+        self.session = self._create_session()
+
+        # Attachment download pool, created on first use
+        self._attachment_executor: Optional[ThreadPoolExecutor] = None
+        self._executor_lock = threading.Lock()
+
+        # Page versions as of their last export (page_id -> version), loaded by run()
+        self._page_versions: Dict[str, int] = {}
+
+        # Resolved page IDs keyed by (space_key, title)
+        self._parent_id_cache: Dict[Tuple[str, str], str] = {}
+
         logger.info("Confluence downloader initialized with comprehensive tracking")
 
+    def _create_session(self) -> requests.Session:
+        """Create a pooled HTTP session with authentication and retries configured
+
+        Returns:
+            Configured requests session
+        """
+        session = requests.Session()
+        session.auth = (self.username, self.password)
+        session.verify = self.verify_ssl
+
+        # Transient failures (throttling, gateway errors) are retried with exponential backoff,
+        # honouring Retry-After, before a request counts as failed; once retries run out the final
+        # response is returned (not raised) so callers' status-code handling still applies
+        retries = Retry(
+            total=5,
+            connect=3,
+            read=3,
+            status=5,
+            backoff_factor=0.5,
+            status_forcelist=(429, 500, 502, 503, 504),
+            allowed_methods={"GET", "HEAD"},
+            respect_retry_after_header=True,
+            raise_on_status=False,
+        )
+        adapter = HTTPAdapter(
+            pool_connections=self.POOL_CONNECTIONS,
+            pool_maxsize=max(self.POOL_MAXSIZE, self.max_workers + self.ATTACHMENT_WORKERS),
+            max_retries=retries,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    def close(self) -> None:
+        """Close the HTTP session and attachment pool and release pooled connections"""
+        with self._executor_lock:
+            if self._attachment_executor is not None:
+                self._attachment_executor.shutdown()
+                self._attachment_executor = None
+        self.session.close()
+
+    def _get_attachment_executor(self) -> ThreadPoolExecutor:
+        """Get the thread pool used for attachment downloads, creating it if needed
+
+        The pool is separate from the page export pool so page workers can
+        block on their attachments without starving it.
+
+        Returns:
+            Shared attachment download executor
+        """
+        with self._executor_lock:
+            if self._attachment_executor is None:
+                self._attachment_executor = ThreadPoolExecutor(
+                    max_workers=self.ATTACHMENT_WORKERS, thread_name_prefix="attachment"
+                )
+            return self._attachment_executor
+
+    def __enter__(self) -> "ConfluenceDownloader":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
     def get_parent_page_id(self, page_title: str) -> Optional[str]:
         """Get the parent page ID from Confluence by title"""
-        response = requests.get(
+        cache_key = (self.space_key, page_title)
+        if cache_key in self._parent_id_cache:
+            return self._parent_id_cache[cache_key]
+
+        # Only the first match's ID is used, so don't ask for more
+        response = self.session.get(
             f"{self.confluence_url}/rest/api/content",
-            auth=(self.username, self.password),
-            params={"spaceKey": self.space_key, "title": page_title, "expand": "ancestors"},
-            verify=self.verify_ssl,
+            params={"spaceKey": self.space_key, "title": page_title, "limit": 1},
         )
 
         if response.status_code == 200:
-            data = response.json()
+            data = self._json(response)
             if data["results"]:
                 parent_page_id = data["results"][0]["id"]
                 logger.info(f"Parent Page ID: {parent_page_id}")
+                self._parent_id_cache[cache_key] = parent_page_id
                 return parent_page_id
             else:
                 logger.warning("Page not found")
@@ -74,50 +222,240 @@ class ConfluenceDownloader:
             logger.error(f"Error fetching parent page: {response.status_code}")
             return None
 
-    def get_children_recursive(self, parent_id: str) -> List[Dict[str, Any]]:
-        """Exact copy of the original get_children_recursive function"""
-        all_pages: List[Dict[str, Any]] = []
-        start = 0
-        limit = 100  # Confluence's max per request
+    def get_descendants(self, root_id: str) -> List[Dict[str, Any]]:
+        """Fetch all descendant pages of a root page with a single CQL search
+
+        Paginating one ``ancestor`` query needs far fewer requests than listing
+        the children of every page in the tree. Falls back to
+        ``get_children_recursive`` when the search endpoint is unavailable.
+
+        Args:
+            root_id: Confluence page ID to start from
 
-        while True:
-            url = urljoin(self.confluence_url, f"/rest/api/content/{parent_id}/child/page")
-            params = {"limit": limit, "start": start, "expand": "children.page"}
+        Returns:
+            List of descendant page dictionaries
+        """
+        pages: List[Dict[str, Any]] = []
+        url: Optional[str] = urljoin(self.confluence_url, "/rest/api/content/search")
+        params: Optional[Dict[str, Any]] = {
+            "cql": f'ancestor="{root_id}" and type=page',
+            "limit": self.PAGE_LIMIT,
+            "expand": self.PAGE_EXPAND,
+        }
 
-            response = requests.get(  # type: ignore[arg-type]
-                url, auth=(self.username, self.password), params=params, verify=self.verify_ssl
-            )
+        while url:
+            response = self.session.get(url, params=params)  # type: ignore[arg-type]
 
             if response.status_code != 200:
-                print(f"Error: {response.status_code}")
-                break
+                logger.warning(
+                    f"CQL descendant search failed ({response.status_code}), falling back to child page traversal"
+                )
+                return self.get_children_recursive(root_id)
 
-            data = response.json()
-            children = data["results"]
-            all_pages.extend(children)
+            data = self._json(response)
+            pages.extend(data["results"])
+
+            url = self._next_page_url(data)
+            params = None
 
-            # Recursively fetch grandchildren
-            for child in children:
-                all_pages.extend(self.get_children_recursive(child["id"]))
+        return pages
+
+    def get_children_recursive(self, parent_id: str) -> List[Dict[str, Any]]:
+        """Fetch all descendant pages of a parent page
 
-            if data["size"] < limit:
-                break
+        Child listings are fetched concurrently from a shared worklist: as soon
+        as a page's listing arrives, its children are queued, so deep branches
+        don't wait for the rest of their level to finish.
 
-            start += limit
+        Args:
+            parent_id: Confluence page ID to start from
+
+        Returns:
+            List of descendant page dictionaries, in breadth-first order
+        """
+        children_by_parent: Dict[str, List[Dict[str, Any]]] = {}
+
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending = {executor.submit(self._get_child_pages, parent_id): parent_id}
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    children = future.result()
+                    children_by_parent[pending.pop(future)] = children
+                    # Only descend into pages whose expanded listing says they have children
+                    for child in children:
+                        if self._has_child_pages(child):
+                            pending[executor.submit(self._get_child_pages, child["id"])] = child["id"]
+
+        # Completion order is arbitrary; rebuild a stable breadth-first listing
+        all_pages: List[Dict[str, Any]] = []
+        level = [parent_id]
+        while level:
+            children = [child for page_id in level for child in children_by_parent.get(page_id, [])]
+            all_pages.extend(children)
+            level = [child["id"] for child in children]
 
         return all_pages
 
-    def export_pdf_and_attachments(self, page_id: str, title: str) -> Tuple[bool, Dict[str, Any]]:
+    @staticmethod
+    def _json(response: requests.Response) -> Any:
+        """Parse a JSON response body, using orjson when it is installed
+
+        Large expanded listings make JSON decoding a noticeable share of the
+        traversal; orjson parses them several times faster than the stdlib.
+
+        Args:
+            response: Response with a JSON body
+
+        Returns:
+            Parsed JSON document
+        """
+        if ORJSON_AVAILABLE:
+            try:
+                return orjson.loads(response.content)
+            except orjson.JSONDecodeError:
+                # orjson rejects some documents the stdlib accepts (e.g. NaN/Infinity)
+                pass
+        return response.json()
+
+    def _next_page_url(self, data: Dict[str, Any]) -> Optional[str]:
+        """Resolve the ``_links.next`` cursor of a paginated Confluence response
+
+        Args:
+            data: Parsed JSON response body
+
+        Returns:
+            Absolute URL of the next result window, or None on the last window
+        """
+        links = data.get("_links", {})
+        next_link = links.get("next")
+        if not next_link:
+            return None
+
+        base = links.get("base") or self.confluence_url
+        return base.rstrip("/") + next_link
+
+    @staticmethod
+    def _safe_title(title: str) -> str:
+        """Sanitize a page title for use as a file name
+
+        Args:
+            title: Page title
+
+        Returns:
+            Title with every non-alphanumeric character replaced by "_"
+        """
+        return _UNSAFE_TITLE_CHARS.sub("_", title).rstrip("_")
+
+    @classmethod
+    def _unique_safe_titles(cls, pages: List[Dict[str, Any]]) -> Dict[str, str]:
+        """Assign every page a file name stem that no other page in the export uses
+
+        Pages are exported concurrently, so two titles that sanitize to the
+        same name (e.g. "A/B" and "A:B") would write the same files at the same
+        time. Such pages get their page ID appended.
+
+        Args:
+            pages: Page dictionaries to export
+
+        Returns:
+            Mapping of page ID to file name stem
+        """
+        safe_titles = {page["id"]: cls._safe_title(page["title"]) for page in pages}
+        counts = Counter(safe_titles.values())
+        return {
+            page_id: f"{safe_title}_{page_id}" if counts[safe_title] > 1 else safe_title
+            for page_id, safe_title in safe_titles.items()
+        }
+
+    @staticmethod
+    def _expanded_attachments(page: Dict[str, Any]) -> Optional[List[Dict[str, Any]]]:
+        """Get the attachment list expanded on a page listing
+
+        Args:
+            page: Page dictionary from a descendant or child listing
+
+        Returns:
+            Attachment dictionaries, or None if the expansion is missing or
+            truncated and the attachments must be fetched separately
+        """
+        listing = page.get("children", {}).get("attachment")
+        if listing is None or "results" not in listing or listing.get("_links", {}).get("next"):
+            return None
+        return listing["results"]
+
+    @staticmethod
+    def _has_child_pages(page: Dict[str, Any]) -> bool:
+        """Check whether a page may have child pages
+
+        Uses the ``children.page`` expansion returned with each listing so leaf
+        pages don't cost an extra request. Pages without the expansion are
+        assumed to have children.
+
+        Args:
+            page: Page dictionary from a child listing
+
+        Returns:
+            False only if the page is known to have no child pages
+        """
+        child_listing = page.get("children", {}).get("page", {})
+        return child_listing.get("size", 1) > 0
+
+    def _get_child_pages(self, parent_id: str) -> List[Dict[str, Any]]:
+        """Fetch the direct child pages of a single page, following pagination
+
+        Args:
+            parent_id: Confluence page ID
+
+        Returns:
+            List of direct child page dictionaries
+
+        Raises:
+            requests.RequestException: If a listing request still fails after retries
+        """
+        children: List[Dict[str, Any]] = []
+        url: Optional[str] = urljoin(self.confluence_url, f"/rest/api/content/{parent_id}/child/page")
+        # The next link already carries the query string, so params only apply to the first request
+        params: Optional[Dict[str, Any]] = {
+            "limit": self.PAGE_LIMIT,
+            "expand": f"children.page,{self.PAGE_EXPAND}",
+        }
+
+        while url:
+            response = self.session.get(url, params=params)  # type: ignore[arg-type]
+
+            # Fail loudly rather than return a partial tree; the error is reported by run()
+            response.raise_for_status()
+
+            data = self._json(response)
+            children.extend(data["results"])
+
+            url = self._next_page_url(data)
+            params = None
+
+        return children
+
+    def export_pdf_and_attachments(
+        self,
+        page_id: str,
+        title: str,
+        attachments: Optional[List[Dict[str, Any]]] = None,
+        version: Optional[int] = None,
+        safe_title: Optional[str] = None,
+    ) -> Tuple[bool, Dict[str, Any]]:
         """Export PDF and attachments with comprehensive metadata tracking
 
         Args:
             page_id: Confluence page ID
             title: Page title
+            attachments: Attachment metadata already fetched with the page; fetched from the API if None
+            version: Current page version; the PDF export is skipped if it matches the last exported version
+            safe_title: File name stem for the PDF and attachment directory (defaults to the sanitized title)
 
         Returns:
             Tuple of (success, metadata_dict)
         """
-        safe_title = "".join(c if c.isalnum() or c == "_" else "_" for c in title).rstrip("_")
+        safe_title = safe_title or self._safe_title(title)
 
         # Initialize result tracking
         result: Dict[str, Any] = {
@@ -133,104 +471,446 @@ class ConfluenceDownloader:
         }
 
         # Store page metadata
-        self.page_metadata[page_id] = {"title": title, "safe_title": safe_title, "id": page_id}
+        with self._metadata_lock:
+            self.page_metadata[page_id] = {"title": title, "safe_title": safe_title, "id": page_id}
 
         try:
-            # Export PDF
-            pdf_url = urljoin(self.confluence_url, f"/spaces/flyingpdf/pdfpageexport.action?pageId={page_id}")
-            pdf_response = requests.get(
-                pdf_url, auth=(self.username, self.password), stream=True, verify=self.verify_ssl
-            )
-
-            if pdf_response.status_code == 200:
-                pdf_file_path = f"{self.output_dir}/{safe_title}.pdf"
-                with open(pdf_file_path, "wb") as f:
-                    for chunk in pdf_response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            # Get attachments unless the listing already came with the page
+            if attachments is None:
+                attachments_url = urljoin(self.confluence_url, f"/rest/api/content/{page_id}/child/attachment")
+                attachments_response = self.session.get(attachments_url)
+
+                if attachments_response.status_code == 200:
+                    attachments = self._json(attachments_response)["results"]
+                else:
+                    error_msg = f"Failed to fetch attachments for {title}: {attachments_response.status_code}"
+                    result["errors"].append(error_msg)
+                    logger.error(error_msg)
 
-                result["pdf_exported"] = True
-                logger.info(f"Exported PDF: {safe_title}.pdf")
-            else:
-                error_msg = f"Failed to export PDF {title}: {pdf_response.status_code}"
+            # Start the attachment downloads first so they overlap with the PDF export below
+            attachment_futures = []
+            if attachments is not None:
+                with self._metadata_lock:
+                    self.attachment_metadata[page_id] = attachments
+
+                executor = self._get_attachment_executor()
+                attachment_futures = [
+                    executor.submit(self._download_single_attachment, attachment, safe_title)
+                    for attachment in attachments
+                ]
+
+            try:
+                # Export PDF
+                pdf_url = urljoin(self.confluence_url, f"/spaces/flyingpdf/pdfpageexport.action?pageId={page_id}")
+                pdf_file_path = self.output_root / f"{safe_title}.pdf"
+
+                with self._metadata_lock:
+                    exported_version = self._page_versions.get(page_id)
+
+                if version is not None and exported_version == version and pdf_file_path.exists():
+                    result["pdf_exported"] = True
+                    logger.info(f"Page unchanged since last export, skipping PDF: {safe_title}.pdf")
+                else:
+                    pdf_status = self._download_resumable(pdf_url, pdf_file_path)
+
+                    if pdf_status in (200, 206):
+                        result["pdf_exported"] = True
+                        logger.info(f"Exported PDF: {safe_title}.pdf")
+                    else:
+                        error_msg = f"Failed to export PDF {title}: {pdf_status}"
+                        result["errors"].append(error_msg)
+                        logger.error(error_msg)
+
+                if result["pdf_exported"] and version is not None:
+                    with self._metadata_lock:
+                        self._page_versions[page_id] = version
+            finally:
+                # Collect the attachment downloads even if the PDF export raised, so none are left running
+                # unreported
+                if attachments is not None:
+                    self._collect_attachment_downloads(title, attachment_futures, result)
+
+            # Determine success
+            success = result["pdf_exported"] and result["attachments_failed"] == 0
+            return success, result
+
+        except Exception as e:
+            error_msg = f"Export failed for {title}: {str(e)}"
+            result["errors"].append(error_msg)
+            logger.error(error_msg)
+            return False, result
+
+    def _collect_attachment_downloads(
+        self, title: str, attachment_futures: List[Future], result: Dict[str, Any]
+    ) -> None:
+        """Wait for a page's attachment downloads and record them in its export result
+
+        Args:
+            title: Page title
+            attachment_futures: Futures of ``_download_single_attachment``, in listing order
+            result: Export result dictionary to update
+        """
+        downloaded_files = []
+        for future in attachment_futures:
+            try:
+                success, filename = future.result()
+            except Exception as e:
+                error_msg = f"Attachment download failed for {title}: {str(e)}"
                 result["errors"].append(error_msg)
                 logger.error(error_msg)
+                success, filename = False, None
 
-            # Get and download attachments
-            attachments_url = urljoin(self.confluence_url, f"/rest/api/content/{page_id}/child/attachment")
-            attachments_response = requests.get(
-                attachments_url, auth=(self.username, self.password), verify=self.verify_ssl
-            )
+            if success and filename:
+                result["attachments_downloaded"] += 1
+                downloaded_files.append(filename)
+                result["attachment_files"].append(filename)
 
-            if attachments_response.status_code == 200:
-                attachments = attachments_response.json()["results"]
-                self.attachment_metadata[page_id] = attachments
+                # Count images
+                if filename.lower().endswith(_IMAGE_EXTENSIONS):
+                    result["images_count"] += 1
+            else:
+                result["attachments_failed"] += 1
 
-                downloaded_files = []
-                for attachment in attachments:
-                    success, filename = self._download_single_attachment(attachment, safe_title)
+        with self._metadata_lock:
+            self.downloaded_attachments[title] = downloaded_files
 
-                    if success and filename:
-                        result["attachments_downloaded"] += 1
-                        downloaded_files.append(filename)
-                        result["attachment_files"].append(filename)
+    def _download_resumable(self, url: str, file_path: Path) -> int:
+        """Download a file via a ``.part`` file, resuming an interrupted earlier download
 
-                        # Count images
-                        if any(filename.lower().endswith(ext) for ext in [".png", ".jpg", ".jpeg", ".gif", ".svg"]):
-                            result["images_count"] += 1
-                    else:
-                        result["attachments_failed"] += 1
+        If a partial file is left over from an earlier run, only the missing
+        tail is requested with a ``Range`` header, guarded by ``If-Range`` so
+        the server sends the whole file again if it changed in the meantime.
+        Partial files without a recorded validator (ETag or Last-Modified) are
+        discarded: PDF exports are rendered on every request, and the tail of
+        one render must never be appended to another. The partial file is only
+        renamed to its final name once the body has been written completely,
+        so an interrupted download never looks like a finished one.
 
-                self.downloaded_attachments[title] = downloaded_files
+        Args:
+            url: Download URL
+            file_path: Final destination file path
 
+        Returns:
+            HTTP status code of the download response (200 or 206 on success)
+        """
+        part_path = file_path.with_name(file_path.name + ".part")
+        meta_path = part_path.with_name(part_path.name + self.META_SUFFIX)
+
+        validator = self._read_download_meta(meta_path).get("validator") if part_path.exists() else None
+        if part_path.exists() and not validator:
+            logger.info(f"Discarding partial download without validator: {part_path.name}")
+            part_path.unlink()
+
+        offset = part_path.stat().st_size if part_path.exists() else 0
+        headers = {"Range": f"bytes={offset}-", "If-Range": validator} if offset and validator else {}
+
+        response = self.session.get(url, stream=True, headers=headers)
+
+        if response.status_code == 416:
+            # Leftover partial file doesn't match the server copy; start over
+            response.close()
+            part_path.unlink()
+            offset = 0
+            response = self.session.get(url, stream=True)
+
+        if response.status_code == 206 and not response.headers.get("Content-Range", "").startswith(f"bytes {offset}-"):
+            logger.warning(f"Unexpected Content-Range for {url}, downloading it again")
+            response.close()
+            response = self.session.get(url, stream=True)
+
+        # Closing the streamed response hands its connection back to the pool, also on failures
+        with response:
+            if response.status_code == 206:
+                logger.info(f"Resuming download of {file_path.name} at byte {offset}")
+                self._save_response(response, part_path, append=True)
+            elif response.status_code == 200:
+                # Record the validator first, so an interrupted download can be resumed safely
+                validator = self._resume_validator(response)
+                if validator:
+                    with open(meta_path, "w", encoding="utf-8") as f:
+                        json.dump({"validator": validator}, f)
+                else:
+                    meta_path.unlink(missing_ok=True)
+                self._save_response(response, part_path)
             else:
-                error_msg = f"Failed to fetch attachments for {title}: {attachments_response.status_code}"
-                result["errors"].append(error_msg)
-                logger.error(error_msg)
+                return response.status_code
 
-            # Determine success
-            success = result["pdf_exported"] and result["attachments_failed"] == 0
-            return success, result
+        part_path.replace(file_path)
+        meta_path.unlink(missing_ok=True)
+        return response.status_code
 
-        except Exception as e:
-            error_msg = f"Export failed for {title}: {str(e)}"
-            result["errors"].append(error_msg)
-            logger.error(error_msg)
-            return False, result
+    @staticmethod
+    def _resume_validator(response: requests.Response) -> Optional[str]:
+        """Pick the validator to send as ``If-Range`` when resuming a download
+
+        Args:
+            response: Full (200) download response
+
+        Returns:
+            The strong ETag, else Last-Modified, or None if the response has neither
+        """
+        etag = response.headers.get("ETag")
+        if etag and not etag.startswith("W/"):
+            # If-Range only accepts strong ETags
+            return etag
+        return response.headers.get("Last-Modified")
+
+    def _save_response(
+        self, response: requests.Response, file_path: Path, digest: Optional[Any] = None, append: bool = False
+    ) -> None:
+        """Stream a response body to disk
+
+        Copies straight from the raw socket stream so the copy loop runs in C
+        instead of iterating over ``iter_content`` chunks in Python.
+
+        Args:
+            response: Streamed response with a successful status
+            file_path: Destination file path
+            digest: Optional hashlib object updated with every chunk written
+            append: Append to an existing file instead of overwriting it
+        """
+        # Let urllib3 undo any Content-Encoding (e.g. gzip) while reading raw
+        response.raw.decode_content = True
+        with open(file_path, "ab" if append else "wb", buffering=self.DOWNLOAD_CHUNK) as f:
+            preallocated = not append and self._preallocate(f.fileno(), response)
+            try:
+                if digest is None:
+                    shutil.copyfileobj(response.raw, f, length=self.DOWNLOAD_CHUNK)
+                else:
+                    for chunk in iter(lambda: response.raw.read(self.DOWNLOAD_CHUNK), b""):
+                        digest.update(chunk)
+                        f.write(chunk)
+            finally:
+                if preallocated:
+                    # Cut the file back to what was actually written, so an interrupted
+                    # .part download has the right size to resume from
+                    f.truncate()
+            f.flush()
+            self._drop_page_cache(f.fileno())
+
+    def _preallocate(self, fd: int, response: requests.Response) -> bool:
+        """Reserve disk space for a download whose size the server announced
+
+        Allocating the whole file up front lets the filesystem lay it out in
+        few extents instead of growing it block by block. Only done for
+        identity-encoded bodies, where ``Content-Length`` is the size on disk.
+
+        Args:
+            fd: File descriptor of the (empty) destination file
+            response: Streamed response being saved
+
+        Returns:
+            True if space was preallocated and the file must be truncated after writing
+        """
+        content_length = response.headers.get("Content-Length", "")
+        if (
+            not hasattr(os, "posix_fallocate")
+            or not content_length.isdigit()
+            or int(content_length) < self.PREALLOCATE_MIN_SIZE
+            or response.headers.get("Content-Encoding", "identity") != "identity"
+        ):
+            return False
+        try:
+            os.posix_fallocate(fd, 0, int(content_length))
+        except OSError as e:
+            logger.debug(f"posix_fallocate failed: {e}")
+            return False
+        return True
+
+    @staticmethod
+    def _drop_page_cache(fd: int) -> None:
+        """Hint the kernel that a freshly written file won't be read back
+
+        Exports are write-once, so keeping them in the page cache only evicts
+        more useful pages (directory and inode metadata) on large runs. The
+        advice also starts writeback of the dirty pages. No-op on platforms
+        without ``posix_fadvise``.
+
+        Args:
+            fd: File descriptor of the written file
+        """
+        if not hasattr(os, "posix_fadvise"):
+            return
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+        except OSError as e:
+            logger.debug(f"posix_fadvise failed: {e}")
+
+    def _store_attachment(
+        self, response: requests.Response, attachment_path: Path, attachment_key: Optional[str]
+    ) -> None:
+        """Save an attachment, hardlinking it to an identical file saved earlier in this run
+
+        The body is streamed to a temporary file while being hashed; if the
+        SHA-256 matches an attachment already on disk, the temporary file is
+        discarded and the existing file is linked in its place.
+
+        Args:
+            response: Streamed attachment response with a successful status
+            attachment_path: Destination file path
+            attachment_key: Attachment ``id@version`` key, if the attachment has an ID
+        """
+        digest = hashlib.sha256()
+        fd, temp_name = tempfile.mkstemp(dir=attachment_path.parent, prefix=".", suffix=".part")
+        os.close(fd)
+        temp_path = Path(temp_name)
+
+        try:
+            self._save_response(response, temp_path, digest)
+            sha = digest.hexdigest()
+
+            with self._dedupe_lock:
+                existing_path = self._attachment_path_by_sha.get(sha)
+                if existing_path and existing_path != attachment_path and existing_path.exists():
+                    self._link_file(existing_path, attachment_path)
+                    temp_path.unlink()
+                else:
+                    # Replace rather than overwrite in place so other hardlinks keep their content
+                    temp_path.replace(attachment_path)
+                    self._attachment_path_by_sha[sha] = attachment_path
+                if attachment_key:
+                    self._attachment_sha_by_id[attachment_key] = sha
+        finally:
+            if temp_path.exists():
+                temp_path.unlink()
+
+    @staticmethod
+    def _link_file(source_path: Path, target_path: Path) -> None:
+        """Hardlink a file to a new path, copying if the filesystem can't link
+
+        Args:
+            source_path: Existing file
+            target_path: Path to create (replaced if it already exists)
+        """
+        if target_path.exists():
+            target_path.unlink()
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            shutil.copyfile(source_path, target_path)
+
+    @staticmethod
+    def _read_download_meta(meta_path: Path) -> Dict[str, Any]:
+        """Read the sidecar metadata recorded for a downloaded file
+
+        Args:
+            meta_path: Path of the JSON sidecar file
+
+        Returns:
+            Recorded metadata, or an empty dict if missing or unreadable
+        """
+        try:
+            with open(meta_path, encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+
+    @staticmethod
+    def _write_download_meta(meta_path: Path, version: Optional[int], etag: Optional[str]) -> None:
+        """Record version and ETag of a downloaded file in its JSON sidecar
+
+        Args:
+            meta_path: Path of the JSON sidecar file
+            version: Confluence version number of the downloaded content
+            etag: ETag returned by the server, if any
+        """
+        with open(meta_path, "w", encoding="utf-8") as f:
+            json.dump({"version": version, "etag": etag}, f)
 
     def _download_single_attachment(self, attachment: Dict, safe_page_title: str) -> Tuple[bool, Optional[str]]:
         """Download a single attachment with error handling
 
         Args:
             attachment: Attachment metadata from Confluence API
-            safe_page_title: Sanitized page title for filename prefix
+            safe_page_title: Sanitized page title, used as the page's attachment subdirectory
 
         Returns:
-            Tuple of (success, filename)
+            Tuple of (success, filename relative to the attachments directory)
         """
         try:
             download_url = urljoin(self.confluence_url, attachment["_links"]["download"])
-            attachment_filename = f"{safe_page_title}_{attachment['title']}"
+            # Attachments are grouped in one directory per page to keep directory listings small
+            attachment_dir = self.attachments_root / safe_page_title
+            attachment_dir.mkdir(parents=True, exist_ok=True)
+            attachment_path = attachment_dir / attachment["title"]
+            attachment_filename = str(attachment_path.relative_to(self.attachments_root))
+            meta_path = attachment_path.with_name(attachment_path.name + self.META_SUFFIX)
+
+            # Skip attachments whose version matches the one recorded at the last download
+            cached_meta = self._read_download_meta(meta_path) if attachment_path.exists() else {}
+            version = attachment.get("version", {}).get("number")
+            if version is not None and cached_meta.get("version") == version:
+                logger.info(f"Attachment up to date, skipping download: {attachment_filename}")
+                return True, attachment_filename
 
-            attachment_response = requests.get(
-                download_url, auth=(self.username, self.password), stream=True, verify=self.verify_ssl
-            )
+            # Identical attachment versions already fetched during this run are hardlinked, not re-downloaded
+            attachment_key = f"{attachment['id']}@{version}" if attachment.get("id") else None
+            with self._dedupe_lock:
+                known_sha = self._attachment_sha_by_id.get(attachment_key) if attachment_key else None
+                existing_path = self._attachment_path_by_sha.get(known_sha) if known_sha else None
+            if existing_path and existing_path.exists():
+                if existing_path != attachment_path:
+                    self._link_file(existing_path, attachment_path)
+                self._write_download_meta(meta_path, version, cached_meta.get("etag"))
+                logger.info(f"Linked duplicate attachment: {attachment_filename}")
+                return True, attachment_filename
 
-            if attachment_response.status_code == 200:
-                attachment_path = f"{self.attachments_dir}/{attachment_filename}"
-                with open(attachment_path, "wb") as f:
-                    for chunk in attachment_response.iter_content(chunk_size=8192):
-                        f.write(chunk)
+            headers = {"If-None-Match": cached_meta["etag"]} if cached_meta.get("etag") else {}
+            # Closing the streamed response hands its connection back to the pool, also on failures
+            with self.session.get(download_url, stream=True, headers=headers) as attachment_response:
+                if attachment_response.status_code == 304:
+                    self._write_download_meta(meta_path, version, cached_meta.get("etag"))
+                    logger.info(f"Attachment not modified, skipping download: {attachment_filename}")
+                    return True, attachment_filename
 
-                logger.info(f"Downloaded attachment: {attachment_filename}")
-                return True, attachment_filename
-            else:
-                logger.error(f"Failed to download attachment: {download_url} - {attachment_response.status_code}")
-                return False, None
+                if attachment_response.status_code == 200:
+                    self._store_attachment(attachment_response, attachment_path, attachment_key)
+                    self._write_download_meta(meta_path, version, attachment_response.headers.get("ETag"))
+
+                    logger.info(f"Downloaded attachment: {attachment_filename}")
+                    return True, attachment_filename
+                else:
+                    logger.error(f"Failed to download attachment: {download_url} - {attachment_response.status_code}")
+                    return False, None
 
         except Exception as e:
             logger.error(f"Exception downloading attachment {attachment.get('title', 'unknown')}: {str(e)}")
             return False, None
 
+    @staticmethod
+    def _load_page_versions(cache_path: Path) -> Dict[str, int]:
+        """Load the page versions recorded by the last export run
+
+        Args:
+            cache_path: Path of the page version cache file
+
+        Returns:
+            Mapping of page ID to exported version, empty if missing or unreadable
+        """
+        try:
+            with open(cache_path, encoding="utf-8") as f:
+                versions = json.load(f)
+        except (OSError, ValueError):
+            return {}
+        return versions if isinstance(versions, dict) else {}
+
+    def _save_page_versions(self, cache_path: Path) -> None:
+        """Write the exported page versions to the cache file
+
+        Args:
+            cache_path: Path of the page version cache file
+        """
+        with self._metadata_lock:
+            versions = dict(self._page_versions)
+
+        temp_path = cache_path.with_name(cache_path.name + ".tmp")
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(versions, f)
+            temp_path.replace(cache_path)
+        except OSError as e:
+            logger.warning(f"Could not write page version cache {cache_path}: {e}")
+
     def run(self, parent_page_title: str) -> Dict[str, Any]:
         """Run the Confluence download process with comprehensive statistics
 
@@ -241,8 +921,11 @@ class ConfluenceDownloader:
             Dictionary with detailed processing results and metadata
         """
         # Ensure directories exist
-        os.makedirs(self.output_dir, exist_ok=True)
-        os.makedirs(self.attachments_dir, exist_ok=True)
+        self.output_root.mkdir(parents=True, exist_ok=True)
+        self.attachments_root.mkdir(parents=True, exist_ok=True)
+
+        page_cache_path = self.output_root / self.PAGE_CACHE_FILE
+        self._page_versions = self._load_page_versions(page_cache_path)
 
         result: Dict[str, Any] = {
             "parent_page_title": parent_page_title,
@@ -262,31 +945,46 @@ class ConfluenceDownloader:
                 result["errors"].append(f"Could not find parent page: {parent_page_title}")
                 return result
 
-            logger.info("Fetching all child pages recursively...")
-            all_pages = self.get_children_recursive(parent_page_id)
+            logger.info("Fetching all descendant pages...")
+            all_pages = self.get_descendants(parent_page_id)
             result["total_pages"] = len(all_pages)
 
             logger.info(f"Found {len(all_pages)} pages. Starting export...")
 
-            for page in all_pages:
-                try:
-                    # Export with comprehensive metadata tracking
-                    success, page_result = self.export_pdf_and_attachments(page["id"], page["title"])
-
-                    result["pages_processed"].append(page_result)
-
-                    if success:
-                        if page_result.get("pdf_exported"):
-                            result["total_pdfs"] += 1
-                        result["total_attachments"] += page_result.get("attachments_downloaded", 0)
-                        result["total_images"] += page_result.get("images_count", 0)
-                    else:
-                        result["errors"].extend(page_result.get("errors", []))
-
-                except Exception as e:
-                    error_msg = f"Failed to process page {page.get('title', 'unknown')}: {str(e)}"
-                    result["errors"].append(error_msg)
-                    logger.error(error_msg)
+            # Pages are independent, so export them concurrently over the shared session
+            safe_titles = self._unique_safe_titles(all_pages)
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                futures = [
+                    executor.submit(
+                        self.export_pdf_and_attachments,
+                        page["id"],
+                        page["title"],
+                        self._expanded_attachments(page),
+                        page.get("version", {}).get("number"),
+                        safe_titles[page["id"]],
+                    )
+                    for page in all_pages
+                ]
+
+                for page, future in zip(all_pages, futures):
+                    try:
+                        # Export with comprehensive metadata tracking
+                        success, page_result = future.result()
+
+                        result["pages_processed"].append(page_result)
+
+                        if success:
+                            if page_result.get("pdf_exported"):
+                                result["total_pdfs"] += 1
+                            result["total_attachments"] += page_result.get("attachments_downloaded", 0)
+                            result["total_images"] += page_result.get("images_count", 0)
+                        else:
+                            result["errors"].extend(page_result.get("errors", []))
+
+                    except Exception as e:
+                        error_msg = f"Failed to process page {page.get('title', 'unknown')}: {str(e)}"
+                        result["errors"].append(error_msg)
+                        logger.error(error_msg)
 
             result["success"] = len(result["errors"]) == 0
 
@@ -305,3 +1003,8 @@ class ConfluenceDownloader:
             result["errors"].append(error_msg)
             logger.error(error_msg)
             return result
+
+        finally:
+            self._save_page_versions(page_cache_path)
+            # Release pooled connections once the export run is over
+            self.close()
@@ -3,10 +3,19 @@ Code Block Formatter for PDF to Markdown conversion
 Formats JSON, YAML, and Bash code blocks according to style guides
 """
 
+import functools
 import json
 import logging
 import re
-from typing import Optional, Tuple
+from typing import Callable, Dict, List, Optional, Pattern, Tuple
+
+try:
+    import orjson  # type: ignore
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+    orjson = None  # type: ignore
 
 try:
     from .indentation_preserver import IndentationPreserver
@@ -16,61 +25,210 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Patterns used on every line of the formatters, compiled once at import
+_BASH_VARIABLE_RE = re.compile(r"\$([a-zA-Z_][a-zA-Z0-9_]*)\b(?![}])")  # $var but not ${var}
+_GO_FUNC_KEYWORD_RE = re.compile(r"func\b")
+_PYTHON_DEDENT_RE = re.compile(r"^(else|elif|except|finally|case)\b")
+# orjson turns integers outside the 64-bit range into floats; such documents are parsed by the stdlib
+_LONG_DIGIT_RUN_RE = re.compile(r"\d{19}")
+# orjson formats floats differently (1e100 vs 1e+100); documents that may hold one are dumped by the stdlib
+_FLOAT_TOKEN_RE = re.compile(r"\d[.eE]")
+
+
+@functools.lru_cache(maxsize=512)
+def _canonical_json(content: str, sort_keys: bool = True) -> str:
+    """Re-serialize a JSON document with 2-space indentation
+
+    Cached because the same snippets tend to recur across the pages of a
+    space; invalid documents raise and are not cached.
+
+    Args:
+        content: Raw JSON content
+        sort_keys: If False, keep object keys in document order instead of sorting them
+
+    Returns:
+        Canonically formatted JSON
+
+    Raises:
+        json.JSONDecodeError: If the content is not valid JSON
+    """
+    if ORJSON_AVAILABLE and not _LONG_DIGIT_RUN_RE.search(content):
+        try:
+            parsed = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # orjson rejects some documents the stdlib accepts (e.g. NaN/Infinity)
+            parsed = json.loads(content)
+        else:
+            if not _FLOAT_TOKEN_RE.search(content):
+                # Byte-for-byte the same output as the stdlib call below for float-free documents
+                option = orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS if sort_keys else orjson.OPT_INDENT_2
+                try:
+                    return orjson.dumps(parsed, option=option).decode()
+                except orjson.JSONEncodeError:
+                    # orjson refuses to serialize documents nested deeper than 255 levels
+                    pass
+    else:
+        parsed = json.loads(content)
+    return json.dumps(parsed, indent=2, ensure_ascii=False, sort_keys=sort_keys)
+
+
+def _compile_language_patterns(
+    language_patterns: Dict[str, List[str]], required_text: Dict[str, str]
+) -> Dict[str, List[Tuple[str, Pattern[str]]]]:
+    """Compile the detection patterns of each language
+
+    Args:
+        language_patterns: Raw regex patterns per language
+        required_text: Text a pattern cannot match without, keyed by raw pattern
+
+    Returns:
+        (required text, compiled pattern) pairs per language; patterns without required text get ""
+    """
+    return {
+        language: [
+            (required_text.get(pattern, ""), re.compile(pattern, re.MULTILINE | re.IGNORECASE)) for pattern in patterns
+        ]
+        for language, patterns in language_patterns.items()
+    }
+
 
 class CodeFormatter:
     """Configurable code formatter with both standardized and preserved indentation modes"""
 
-    def __init__(self, preserve_indentation: bool = False, min_cleanup: bool = True):
+    # Number of detect_language / format_code_block results memoized per formatter
+    RESULT_CACHE_SIZE = 1024
+
+    # Script openings that identify bash without scoring the patterns
+    BASH_SHEBANGS = ("#!/bin/bash", "#!/bin/sh")
+    BASH_SCRIPT_PREFIXES = ("VERBOSE=", "INPUT_FILE=", "NS=")
+
+    # Words whose presence anywhere marks otherwise unscored content as bash
+    BASH_FALLBACK_KEYWORDS = ("while", "case", "esac", "done", "echo")
+
+    # Bash keywords that close a block and decrease indentation
+    BASH_BLOCK_CLOSERS = ("fi", "done", "esac", "}", ";;")
+
+    # Bash lines indented one level less than the lines before them
+    BASH_DEDENT_LINES = frozenset({"else", "elif", "esac", "fi", "done"})
+    BASH_DEDENT_PREFIXES = ("else ", "else)", "elif ", "elif)", "esac ", "esac)", ";;", "}")
+
+    # Line endings that open a bash block
+    BASH_BLOCK_OPENER_SUFFIXES = ("then", "do", "{")
+
+    # Detection patterns per language, in priority order
+    LANGUAGE_PATTERNS = {
+        "json": [
+            r"^\s*[{\[]",  # Starts with { or [
+            r'["\']:\s*["\']',  # Key-value pairs with quotes
+            r"\}\s*,?\s*$",  # Ends with }
+        ],
+        "yaml": [
+            r"^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*:",  # Key: value
+            r"^\s*-\s+",  # List items
+            r":\s*[|\>]",  # Block scalars
+        ],
+        "bash": [
+            r"#!/bin/(bash|sh)",  # Shebang
+            r"\$\{?[a-zA-Z_][a-zA-Z0-9_]*\}?",  # Variables
+            r"\b(echo|if|then|else|elif|fi|for|while|do|done|case|esac|function)\b",  # Bash keywords
+            r"^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=",  # Variable assignments
+            r"\[\[.*\]\]",  # Bash conditional expressions
+            r"^\s*#(?!\s*[{\[])",  # Comments (but not JSON-like)
+        ],
+        "go": [
+            r"\bpackage\s+\w+",  # Package declaration
+            r"\bfunc\s+\w*\s*\(",  # Function declaration
+            r"\bimport\s*\(",  # Import statement
+            r"\bvar\s+\w+\s+\w+",  # Variable declaration
+            r"\b(defer|chan|select|interface|struct|range|map)\b",  # Go-specific keywords
+            r":=",  # Short variable declaration
+            r"^\s*//",  # Go-style comments
+        ],
+        "python": [
+            r"^def\s+\w+\s*\(",  # Function definition
+            r"^class\s+\w+",  # Class definition
+            r"\bimport\s+\w+",  # Import statement
+            r"\bfrom\s+\w+\s+import",  # From import
+            r"\b(print|len|range|str|int|float|list|dict|tuple|set)\s*\(",  # Built-ins
+            r"^\s*#(?!\s*[{\[])",  # Python comments
+            r":\s*$",  # Colon at end of line (common in Python)
+        ],
+    }
+
+    # Punctuation a detection pattern cannot match without; a substring check rules the pattern out
+    # far more cheaply than running the regex over text that lacks it
+    PATTERN_REQUIRED_TEXT = {
+        r'["\']:\s*["\']': ":",
+        r"\}\s*,?\s*$": "}",
+        r"^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*:": ":",
+        r"^\s*-\s+": "-",
+        r":\s*[|\>]": ":",
+        r"#!/bin/(bash|sh)": "#!/",
+        r"\$\{?[a-zA-Z_][a-zA-Z0-9_]*\}?": "$",
+        r"^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=": "=",
+        r"\[\[.*\]\]": "[[",
+        r"^\s*#(?!\s*[{\[])": "#",
+        r"\bfunc\s+\w*\s*\(": "(",
+        r"\bimport\s*\(": "(",
+        r":=": ":=",
+        r"^\s*//": "//",
+        r"^def\s+\w+\s*\(": "(",
+        r"\b(print|len|range|str|int|float|list|dict|tuple|set)\s*\(": "(",
+        r":\s*$": ":",
+    }
+
+    # Patterns compiled once for all instances, paired with their required text
+    _COMPILED_PATTERNS = _compile_language_patterns(LANGUAGE_PATTERNS, PATTERN_REQUIRED_TEXT)
+
+    # Go and Python lines that close a block and dedent themselves
+    GO_CLOSING_LINES = frozenset({"}", "}):", "},", "];"})
+    PYTHON_CLOSING_LINES = frozenset({")", "]", "}"})
+
+    # Line endings that open a bracketed block
+    BRACKET_OPENER_SUFFIXES = ("(", "[", "{")
+
+    def __init__(self, preserve_indentation: bool = False, min_cleanup: bool = True, sort_json_keys: bool = True):
         """Initialize the code formatter
 
         Args:
             preserve_indentation: If True, preserve original PDF indentation instead of standardizing
             min_cleanup: If True and preserve_indentation=True, apply minimal cleanup
+            sort_json_keys: If False, JSON blocks keep their key order instead of having keys sorted
         """
         self.preserve_indentation = preserve_indentation
+        self.sort_json_keys = sort_json_keys
         self.indentation_preserver = IndentationPreserver(min_cleanup=min_cleanup) if preserve_indentation else None
-        self.language_patterns = {
-            "json": [
-                r"^\s*[{\[]",  # Starts with { or [
-                r'["\']:\s*["\']',  # Key-value pairs with quotes
-                r"\}\s*,?\s*$",  # Ends with }
-            ],
-            "yaml": [
-                r"^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*:",  # Key: value
-                r"^\s*-\s+",  # List items
-                r":\s*[|\>]",  # Block scalars
-            ],
-            "bash": [
-                r"#!/bin/(bash|sh)",  # Shebang
-                r"\$\{?[a-zA-Z_][a-zA-Z0-9_]*\}?",  # Variables
-                r"\b(echo|if|then|else|elif|fi|for|while|do|done|case|esac|function)\b",  # Bash keywords
-                r"^\s*[a-zA-Z_][a-zA-Z0-9_]*\s*=",  # Variable assignments
-                r"\[\[.*\]\]",  # Bash conditional expressions
-                r"^\s*#(?!\s*[{\[])",  # Comments (but not JSON-like)
-            ],
-            "go": [
-                r"\bpackage\s+\w+",  # Package declaration
-                r"\bfunc\s+\w*\s*\(",  # Function declaration
-                r"\bimport\s*\(",  # Import statement
-                r"\bvar\s+\w+\s+\w+",  # Variable declaration
-                r"\b(defer|chan|select|interface|struct|range|map)\b",  # Go-specific keywords
-                r":=",  # Short variable declaration
-                r"^\s*//",  # Go-style comments
-            ],
-            "python": [
-                r"^def\s+\w+\s*\(",  # Function definition
-                r"^class\s+\w+",  # Class definition
-                r"\bimport\s+\w+",  # Import statement
-                r"\bfrom\s+\w+\s+import",  # From import
-                r"\b(print|len|range|str|int|float|list|dict|tuple|set)\s*\(",  # Built-ins
-                r"^\s*#(?!\s*[{\[])",  # Python comments
-                r":\s*$",  # Colon at end of line (common in Python)
-            ],
+        self.language_patterns = self.LANGUAGE_PATTERNS
+        self._compiled_patterns = self._COMPILED_PATTERNS
+
+        # Formatter for each recognized language
+        self._formatters: Dict[str, Callable[[str], str]] = {
+            "json": self.format_json,
+            "yaml": self.format_yaml,
+            "bash": self.format_bash,
+            "go": self.format_go,
+            "python": self.format_python,
         }
 
+        # Identical blocks recur across documents (license headers, example snippets), so results are
+        # memoized per instance; they depend on this formatter's settings
+        self._detect_language_cached = functools.lru_cache(maxsize=self.RESULT_CACHE_SIZE)(self._detect_language)
+        self._format_code_block_cached = functools.lru_cache(maxsize=self.RESULT_CACHE_SIZE)(self._format_code_block)
+
     def detect_language(self, code_content: str) -> str:
         """Detect the programming language of code content
 
+        Args:
+            code_content: Raw code content
+
+        Returns:
+            Detected language ('json', 'yaml', 'bash', 'go', 'python', or 'text')
+        """
+        return self._detect_language_cached(code_content)
+
+    def _detect_language(self, code_content: str) -> str:
+        """Detect the programming language of code content (uncached)
+
         Args:
             code_content: Raw code content
 
@@ -83,11 +241,11 @@ class CodeFormatter:
             return "text"
 
         # Priority 1: Check for strong single indicators first
-        if code_content.startswith("#!/bin/bash") or code_content.startswith("#!/bin/sh"):
+        if code_content.startswith(self.BASH_SHEBANGS):
             return "bash"
 
         # Also check for common bash script patterns at the start
-        if re.match(r"^(VERBOSE|INPUT_FILE|NS)=", code_content, re.MULTILINE):
+        if code_content.startswith(self.BASH_SCRIPT_PREFIXES):
             return "bash"
 
         if (code_content.startswith("{") and code_content.endswith("}")) or (
@@ -95,32 +253,54 @@ class CodeFormatter:
         ):
             return "json"
 
-        # Priority 2: Check each language pattern with scoring
-        language_scores = {}
-        for language, patterns in self.language_patterns.items():
-            matches = 0
-            for pattern in patterns:
-                if re.search(pattern, code_content, re.MULTILINE | re.IGNORECASE):
-                    matches += 1
+        # Priority 2: Score the languages, stopping as soon as the outcome is known.
+        # Bash wins with at least 2 matches if no language scores higher; otherwise the first
+        # language (in pattern order) with at least 2 matches wins.
+        bash_score = self._count_matches("bash", code_content) if "bash" in self._compiled_patterns else 0
 
-            language_scores[language] = matches
-
-        # Priority 3: Determine best match
-        # For bash, if we have at least 2 matches and it's the highest, choose it
-        if language_scores.get("bash", 0) >= 2 and language_scores["bash"] >= max(language_scores.values()):
+        if bash_score < 2:
+            for language in self._compiled_patterns:
+                if language != "bash" and self._count_matches(language, code_content, limit=2) >= 2:
+                    return language
+        else:
+            # Bash is a candidate itself, so the first candidate is known by the time a language outscores bash
+            first_candidate = ""
+            for language in self._compiled_patterns:
+                score = (
+                    bash_score if language == "bash" else self._count_matches(language, code_content, bash_score + 1)
+                )
+                if not first_candidate and score >= 2:
+                    first_candidate = language
+                if score > bash_score:
+                    return first_candidate
             return "bash"
 
-        # For other languages, require at least 2 matches
-        for language, score in language_scores.items():
-            if score >= 2:
-                return language
-
         # Priority 4: Fallback checks
-        if any(keyword in code_content.lower() for keyword in ["while", "case", "esac", "done", "echo"]):
+        lowered = code_content.lower()
+        if any(keyword in lowered for keyword in self.BASH_FALLBACK_KEYWORDS):
             return "bash"
 
         return "text"
 
+    def _count_matches(self, language: str, code_content: str, limit: Optional[int] = None) -> int:
+        """Count how many of a language's patterns match the code
+
+        Args:
+            language: Language key in ``language_patterns``
+            code_content: Code to scan
+            limit: Stop counting once this many patterns have matched
+
+        Returns:
+            Number of matching patterns, capped at ``limit``
+        """
+        matches = 0
+        for required_text, pattern in self._compiled_patterns[language]:
+            if required_text in code_content and pattern.search(code_content):
+                matches += 1
+                if matches == limit:
+                    break
+        return matches
+
     def format_json(self, content: str, raise_on_error: bool = False) -> str:
         """Format JSON content with 2-space indentation
 
@@ -136,9 +316,7 @@ class CodeFormatter:
         """
         try:
             # Parse and reformat with 2-space indentation
-            parsed = json.loads(content)
-            formatted = json.dumps(parsed, indent=2, ensure_ascii=False, sort_keys=True)
-            return formatted
+            return _canonical_json(content, self.sort_json_keys)
         except (json.JSONDecodeError, TypeError) as e:
             if raise_on_error:
                 raise
@@ -159,29 +337,30 @@ class CodeFormatter:
             formatted_lines = []
 
             for line in lines:
-                stripped = line.strip()
+                # Strip the leading whitespace once; its length is the line's indentation
+                lstripped = line.lstrip()
+                stripped = lstripped.rstrip()
                 if not stripped or stripped.startswith("#"):
                     # Preserve empty lines and comments
                     formatted_lines.append(stripped)
                     continue
 
                 # Basic indentation normalization (2 spaces per level)
-                indent_level = len(line) - len(line.lstrip())
+                indent_level = len(line) - len(lstripped)
                 normalized_indent = (indent_level // 2) * 2  # Round to even number
 
-                if ":" in stripped and not stripped.startswith("-"):
+                # stripped has no outer whitespace, so only the inner edges of its parts need stripping
+                indent = " " * normalized_indent
+                if stripped.startswith("-"):
+                    # List item
+                    formatted_lines.append(f"{indent}- {stripped[1:].lstrip()}")
+                elif ":" in stripped:
                     # Key-value pair
                     key, value = stripped.split(":", 1)
-                    formatted_line = " " * normalized_indent + f"{key.strip()}: {value.strip()}"
-                elif stripped.startswith("-"):
-                    # List item
-                    item_content = stripped[1:].strip()
-                    formatted_line = " " * normalized_indent + f"- {item_content}"
+                    formatted_lines.append(f"{indent}{key.rstrip()}: {value.lstrip()}")
                 else:
                     # Other content
-                    formatted_line = " " * normalized_indent + stripped
-
-                formatted_lines.append(formatted_line)
+                    formatted_lines.append(indent + stripped)
 
             return "\n".join(formatted_lines)
 
@@ -203,12 +382,6 @@ class CodeFormatter:
             formatted_lines = []
             indent_level = 0
 
-            # Define keywords that decrease indentation
-            decrease_indent_keywords = ["fi", "done", "esac", "}", ";;"]
-
-            # Define keywords that should be at the same level as their opening
-            same_level_keywords = ["else", "elif", ";;", "esac"]
-
             for line in lines:
                 stripped = line.strip()
 
@@ -221,49 +394,29 @@ class CodeFormatter:
                         formatted_lines.append("")
                     continue
 
-                # Check if we need to decrease indent before processing this line
-                temp_indent = indent_level
-                for keyword in same_level_keywords:
-                    if stripped.startswith(keyword + " ") or stripped == keyword or stripped.startswith(keyword + ")"):
-                        temp_indent = max(0, indent_level - 1)
-                        break
-
-                # Special handling for closing keywords
-                if (
-                    stripped in decrease_indent_keywords
-                    or stripped.startswith(";;")
-                    or stripped == "}"
-                    or stripped.startswith("}")
-                    or stripped == "fi"
-                    or stripped == "done"
-                    or stripped == "esac"
-                ):
+                # Closing keywords and else/elif/esac sit at the level of their opening line
+                if stripped in self.BASH_DEDENT_LINES or stripped.startswith(self.BASH_DEDENT_PREFIXES):
                     temp_indent = max(0, indent_level - 1)
+                else:
+                    temp_indent = indent_level
 
                 # Apply current indentation (2 spaces per level)
                 current_indent = "  " * temp_indent
 
                 # Normalize variable references to use ${} syntax where appropriate
-                formatted_line = re.sub(
-                    r"\$([a-zA-Z_][a-zA-Z0-9_]*)\b(?![}])", r"${\1}", stripped  # $var but not ${var}
-                )
+                formatted_line = _BASH_VARIABLE_RE.sub(r"${\1}", stripped) if "$" in stripped else stripped
 
                 formatted_lines.append(current_indent + formatted_line)
 
                 # Update indent level for next line based on current line
-                if (
-                    any(stripped.endswith(" " + keyword) or stripped.endswith(keyword) for keyword in ["then", "do"])
-                    or stripped.endswith("{")
-                    or any(word in stripped.split() for word in ["if", "while", "for", "function"])
-                    and (stripped.endswith("then") or stripped.endswith("do"))
-                    or re.match(r".*\)\s*$", stripped)
-                    and "case" in stripped
+                if stripped.endswith(self.BASH_BLOCK_OPENER_SUFFIXES) or (
+                    stripped.endswith(")") and "case" in stripped
                 ):
                     indent_level += 1
-                elif stripped.startswith("case ") or re.match(r".*\)\s*$", stripped):  # case patterns like "pattern)"
-                    if not any(word in stripped for word in decrease_indent_keywords):
+                elif stripped.startswith("case ") or stripped.endswith(")"):  # case patterns like "pattern)"
+                    if not any(word in stripped for word in self.BASH_BLOCK_CLOSERS):
                         indent_level += 1
-                elif any(stripped.startswith(keyword) or stripped == keyword for keyword in decrease_indent_keywords):
+                elif stripped.startswith(self.BASH_BLOCK_CLOSERS):
                     indent_level = max(0, indent_level - 1)
 
             return "\n".join(formatted_lines)
@@ -306,21 +459,18 @@ class CodeFormatter:
                     continue
 
                 # Decrease indent for closing braces
-                if stripped in ["}", "}):", "},", "];"]:
+                if stripped in self.GO_CLOSING_LINES:
                     indent_level = max(0, indent_level - 1)
 
                 # Apply tab indentation (Go standard)
                 formatted_line = "\t" * indent_level + stripped
                 formatted_lines.append(formatted_line)
 
-                # Increase indent after opening braces, function declarations, control structures
-                if (
-                    stripped.endswith("{")
-                    or (stripped.endswith("(") and len(stripped) > 10)  # Long function calls
-                    or stripped.endswith("[")
-                    or re.match(r"^(if|for|func|switch|select|type|struct)\b.*{$", stripped)
-                    or re.match(r"^(func)\b.*\($", stripped)
-                ):  # Function parameters spread across lines
+                # Increase indent after opening braces (which covers control structures and declarations),
+                # long function calls and function parameters spread across lines
+                if stripped.endswith(("{", "[")) or (
+                    stripped.endswith("(") and (len(stripped) > 10 or _GO_FUNC_KEYWORD_RE.match(stripped))
+                ):
                     indent_level += 1
 
             return "\n".join(formatted_lines)
@@ -350,7 +500,7 @@ class CodeFormatter:
             formatted_lines = []
             indent_level = 0
 
-            for line_idx, line in enumerate(lines):
+            for line in lines:
                 stripped = line.strip()
 
                 if not stripped:
@@ -363,10 +513,10 @@ class CodeFormatter:
                     continue
 
                 # Handle dedenting keywords (they go back one level)
-                if re.match(r"^(else|elif|except|finally|case)\b", stripped):
+                if _PYTHON_DEDENT_RE.match(stripped):
                     # These keywords dedent one level from current
                     indent_level = max(0, indent_level - 1)
-                elif stripped in [")", "]", "}"]:
+                elif stripped in self.PYTHON_CLOSING_LINES:
                     # Closing brackets dedent
                     indent_level = max(0, indent_level - 1)
 
@@ -374,11 +524,11 @@ class CodeFormatter:
                 formatted_line = "    " * indent_level + stripped
                 formatted_lines.append(formatted_line)
 
-                # Increase indent after lines ending with colon (blocks)
-                if stripped.endswith(":") and not stripped.startswith("#"):
+                # Increase indent after lines ending with colon (blocks); comments were handled above
+                if stripped.endswith(":"):
                     indent_level += 1
                 # Also handle opening brackets
-                elif stripped.endswith("(") or stripped.endswith("[") or stripped.endswith("{"):
+                elif stripped.endswith(self.BRACKET_OPENER_SUFFIXES):
                     indent_level += 1
 
             return "\n".join(formatted_lines)
@@ -390,6 +540,18 @@ class CodeFormatter:
     def format_code_block(self, content: str, language: Optional[str] = None) -> Tuple[str, str]:
         """Format a code block with configurable indentation handling
 
+        Args:
+            content: Raw code content
+            language: Optional language hint
+
+        Returns:
+            Tuple of (formatted_content, detected_language)
+        """
+        return self._format_code_block_cached(content, language)
+
+    def _format_code_block(self, content: str, language: Optional[str] = None) -> Tuple[str, str]:
+        """Format a code block with configurable indentation handling (uncached)
+
         Args:
             content: Raw code content
             language: Optional language hint
@@ -402,8 +564,8 @@ class CodeFormatter:
         detected_language = language if language else self.detect_language(content)
 
         # Apply language-specific formatting if we recognize the language
-        if detected_language in ["bash", "python", "go", "json", "yaml"]:
-            logger.debug(f"Applying {detected_language} formatter (override preservation for code blocks)")
+        if detected_language in self._formatters:
+            logger.debug("Applying %s formatter (override preservation for code blocks)", detected_language)
             # Skip preservation mode for recognized programming languages
             pass  # Continue to standardized formatting below
         elif self.preserve_indentation and self.indentation_preserver:
@@ -438,36 +600,24 @@ class CodeFormatter:
                 else:
                     # Keep original content if detection still says JSON
                     formatted_content = content
-        elif language == "yaml":
-            formatted_content = self.format_yaml(content)
-        elif language == "bash":
-            formatted_content = self.format_bash(content)
-        elif language == "go":
-            formatted_content = self.format_go(content)
-        elif language == "python":
-            formatted_content = self.format_python(content)
+        elif language in self._formatters:
+            formatted_content = self._formatters[language](content)
         else:
             # Try auto-detection for unknown languages
             detected = self.detect_language(content)
-            if detected in ["json", "yaml", "bash", "go", "python"]:
+            formatter = self._formatters.get(detected)
+            if formatter:
                 final_language = detected
-                if detected == "json":
-                    formatted_content = self.format_json(content)
-                elif detected == "yaml":
-                    formatted_content = self.format_yaml(content)
-                elif detected == "bash":
-                    formatted_content = self.format_bash(content)
-                elif detected == "go":
-                    formatted_content = self.format_go(content)
-                elif detected == "python":
-                    formatted_content = self.format_python(content)
+                formatted_content = formatter(content)
             else:
                 # No formatting for truly unknown languages
                 formatted_content = content
 
         logger.debug(
-            f"Formatted code block ({'preserved' if self.preserve_indentation else 'standardized'}): "
-            f"{original_language} -> {final_language}"
+            "Formatted code block (%s): %s -> %s",
+            "preserved" if self.preserve_indentation else "standardized",
+            original_language,
+            final_language,
         )
         return formatted_content, final_language
 
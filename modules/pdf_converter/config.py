@@ -6,6 +6,7 @@ dataclass-based configuration, both loaded from environment variables only.
 """
 
 import logging
+import logging.handlers
 import os
 from dataclasses import dataclass, field
 from typing import Dict, Any, List, Optional, Union
@@ -17,6 +18,41 @@ logger = logging.getLogger(__name__)
 # Load environment variables once at module level
 load_dotenv()
 
+# The dataclass field defaults below read the environment once, at import; the
+# list-valued default is parsed here so each ConverterConfig() only copies it
+_DEFAULT_SUPPORTED_LANGUAGES = tuple(
+    lang.strip() for lang in os.getenv("PDF_SUPPORTED_LANGUAGES", "json,yaml,bash,go,python").split(",")
+)
+
+
+# Log levels accepted by ConverterConfig.log_level
+_VALID_LOG_LEVELS = frozenset({"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"})
+
+# Numeric value of each level name setup_logging accepts (including the WARN/FATAL aliases)
+_LOG_LEVEL_NUMBERS = {
+    name: getattr(logging, name)
+    for name in ("CRITICAL", "FATAL", "ERROR", "WARNING", "WARN", "INFO", "DEBUG", "NOTSET")
+}
+
+# Values (compared case-insensitively) that enable a boolean setting
+_TRUTHY_VALUES = frozenset({"true", "1", "yes", "on"})
+
+
+def _env_bool(name: str, default: bool) -> bool:
+    """Read a boolean setting from the environment
+
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is not set
+
+    Returns:
+        True if the variable is set to a truthy value, the default if it is unset, otherwise False
+    """
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.strip().lower() in _TRUTHY_VALUES
+
 
 def _safe_int(value: str, default: int) -> int:
     """Safely convert string to integer with default fallback"""
@@ -31,32 +67,28 @@ class ConverterConfig:
     """Environment-based configuration for PDF to Markdown conversion"""
 
     # Original converter settings (backward compatible)
-    prefer_gpu: bool = os.getenv("PDF_PREFER_GPU", "true").lower() == "true"
+    prefer_gpu: bool = _env_bool("PDF_PREFER_GPU", True)
     log_level: str = os.getenv("PDF_LOG_LEVEL", "INFO")
     output_format: str = os.getenv("PDF_OUTPUT_FORMAT", "markdown")
 
     # Code formatting settings
-    format_code_blocks: bool = os.getenv("PDF_FORMAT_CODE_BLOCKS", "true").lower() == "true"
-    preserve_indentation: bool = os.getenv("PDF_PRESERVE_INDENTATION", "true").lower() == "true"
-    min_cleanup: bool = os.getenv("PDF_MIN_CLEANUP", "true").lower() == "true"
-    detect_languages: bool = os.getenv("PDF_DETECT_LANGUAGES", "true").lower() == "true"
-    supported_languages: List[str] = field(
-        default_factory=lambda: [
-            lang.strip() for lang in os.getenv("PDF_SUPPORTED_LANGUAGES", "json,yaml,bash,go,python").split(",")
-        ]
-    )
+    format_code_blocks: bool = _env_bool("PDF_FORMAT_CODE_BLOCKS", True)
+    preserve_indentation: bool = _env_bool("PDF_PRESERVE_INDENTATION", True)
+    min_cleanup: bool = _env_bool("PDF_MIN_CLEANUP", True)
+    detect_languages: bool = _env_bool("PDF_DETECT_LANGUAGES", True)
+    supported_languages: List[str] = field(default_factory=lambda: list(_DEFAULT_SUPPORTED_LANGUAGES))
 
     # Output settings
     output_dir: str = os.getenv("PDF_OUTPUT_DIR", "output/markdown")
-    include_metadata: bool = os.getenv("PDF_INCLUDE_METADATA", "false").lower() == "true"
+    include_metadata: bool = _env_bool("PDF_INCLUDE_METADATA", False)
 
     # Processing settings
     timeout: int = _safe_int(os.getenv("PDF_TIMEOUT", "300"), 300)
     max_file_size_mb: int = _safe_int(os.getenv("PDF_MAX_FILE_SIZE_MB", "100"), 100)
 
     # Confluence integration
-    capture_attachment_metadata: bool = os.getenv("PDF_CAPTURE_ATTACHMENT_METADATA", "true").lower() == "true"
-    save_metadata_reports: bool = os.getenv("PDF_SAVE_METADATA_REPORTS", "true").lower() == "true"
+    capture_attachment_metadata: bool = _env_bool("PDF_CAPTURE_ATTACHMENT_METADATA", True)
+    save_metadata_reports: bool = _env_bool("PDF_SAVE_METADATA_REPORTS", True)
 
     # Performance settings
     batch_size: int = _safe_int(os.getenv("PDF_BATCH_SIZE", "10"), 10)
@@ -64,11 +96,12 @@ class ConverterConfig:
 
     def __post_init__(self):
         """Validate configuration after creation"""
-        # Validate log level
-        valid_log_levels = {"DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"}
-        if self.log_level.upper() not in valid_log_levels:
+        # Validate and normalize log level
+        log_level = self.log_level.upper()
+        if log_level not in _VALID_LOG_LEVELS:
             logger.warning(f"Invalid log_level '{self.log_level}', using 'INFO'")
-            self.log_level = "INFO"
+            log_level = "INFO"
+        self.log_level = log_level
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary format for backward compatibility
@@ -114,16 +147,16 @@ def load_config(return_dataclass: bool = False) -> Union[Dict[str, Any], Convert
 
     return {
         "converter": {
-            "format_code_blocks": os.getenv("PDF_FORMAT_CODE_BLOCKS", "true").lower() == "true",
-            "preserve_indentation": os.getenv("PDF_PRESERVE_INDENTATION", "true").lower() == "true",
-            "min_cleanup": os.getenv("PDF_MIN_CLEANUP", "true").lower() == "true",
-            "prefer_gpu": os.getenv("PDF_PREFER_GPU", "true").lower() == "true",
+            "format_code_blocks": _env_bool("PDF_FORMAT_CODE_BLOCKS", True),
+            "preserve_indentation": _env_bool("PDF_PRESERVE_INDENTATION", True),
+            "min_cleanup": _env_bool("PDF_MIN_CLEANUP", True),
+            "prefer_gpu": _env_bool("PDF_PREFER_GPU", True),
             "supported_languages": supported_languages,
             "log_level": os.getenv("PDF_LOG_LEVEL", "INFO").upper(),
         },
         "output": {
             "output_dir": os.getenv("PDF_OUTPUT_DIR", "output/markdown"),
-            "include_metadata": os.getenv("PDF_INCLUDE_METADATA", "false").lower() == "true",
+            "include_metadata": _env_bool("PDF_INCLUDE_METADATA", False),
         },
         "processing": {
             "timeout": _safe_int(os.getenv("PDF_TIMEOUT", "300"), 300),
@@ -132,24 +165,43 @@ def load_config(return_dataclass: bool = False) -> Union[Dict[str, Any], Convert
     }
 
 
-def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None):
+def setup_logging(log_level: str = "INFO", log_file: Optional[str] = None, buffered: bool = False):
     """Setup logging with configurable level and optional file output
 
     Args:
         log_level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         log_file: Optional file path for logging output
+        buffered: If True, console records are buffered and written in batches
+            (immediately on ERROR) so worker threads don't block on console I/O
     """
-    level = getattr(logging, log_level.upper(), logging.INFO)
+    # basicConfig() leaves an already configured root logger untouched; return before creating
+    # handlers it would discard (a discarded FileHandler would keep its log file open)
+    if logging.getLogger().handlers:
+        return
+
+    level = _LOG_LEVEL_NUMBERS.get(log_level.upper(), logging.INFO)
+
+    console_handler: logging.Handler = logging.StreamHandler()
+    if buffered:
+        # basicConfig would only format the buffer, so format the real console handler directly
+        console_format = (
+            "%(asctime)s - %(name)s - %(levelname)s - %(message)s" if log_file else "%(levelname)s: %(message)s"
+        )
+        console_handler.setFormatter(logging.Formatter(console_format))
+        # Flushed when full, on ERROR, and by logging.shutdown() at exit
+        console_handler = logging.handlers.MemoryHandler(
+            capacity=1024, flushLevel=logging.ERROR, target=console_handler
+        )
 
     if not log_file:
         # Console only logging
-        logging.basicConfig(level=level, format="%(levelname)s: %(message)s", handlers=[logging.StreamHandler()])
+        logging.basicConfig(level=level, format="%(levelname)s: %(message)s", handlers=[console_handler])
     else:
         # Console and file logging with detailed format
         formatter = logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
 
         # Create handlers
-        handlers: List[logging.Handler] = [logging.StreamHandler()]
+        handlers: List[logging.Handler] = [console_handler]
 
         file_handler = logging.FileHandler(log_file)
         file_handler.setFormatter(formatter)
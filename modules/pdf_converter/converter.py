@@ -5,24 +5,15 @@ Supports both basic PDF conversion and enhanced Confluence integration
 with image handling capabilities.
 """
 
+import functools
 import logging
 import os
 import re
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Union, Any
 
-from marker.converters.pdf import PdfConverter
-from marker.models import create_model_dict
-from marker.output import text_from_rendered
-
-try:
-    import torch  # type: ignore
-
-    TORCH_AVAILABLE = True
-except ImportError:
-    TORCH_AVAILABLE = False
-    torch = None  # type: ignore
-
 try:
     from .code_formatter import CodeFormatter
     from .marker_cleaner import MarkerOutputCleaner
@@ -33,6 +24,9 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+# Fenced code blocks: ```optional_language\ncontent\n```
+_CODE_BLOCK_RE = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+
 
 class PDFConversionError(Exception):
     """Simple exception for conversion failures"""
@@ -40,6 +34,100 @@ class PDFConversionError(Exception):
     pass
 
 
+# Converter owned by a batch_convert worker process, created once by _init_worker
+_worker_converter: Optional["PDFToMarkdownConverter"] = None
+
+
+def _init_worker(preserve_indentation: bool, min_cleanup: bool) -> None:
+    """Create the CPU converter used by a batch_convert worker process
+
+    Args:
+        preserve_indentation: Indentation mode of the parent converter
+        min_cleanup: Cleanup mode of the parent converter
+    """
+    global _worker_converter
+    _worker_converter = PDFToMarkdownConverter(
+        prefer_gpu=False, preserve_indentation=preserve_indentation, min_cleanup=min_cleanup
+    )
+
+
+def _convert_in_worker(pdf_path: Path, output_path: Path, page_title: Optional[str]) -> Dict:
+    """Convert one PDF in a batch_convert worker process
+
+    Only the summary is sent back; the markdown is written to output_path by the worker.
+
+    Args:
+        pdf_path: Path to the PDF file to convert
+        output_path: Path to write the markdown to
+        page_title: Optional page title
+
+    Returns:
+        Conversion summary
+
+    Raises:
+        PDFConversionError: If conversion fails
+    """
+    assert _worker_converter is not None, "Worker not initialized"
+    _, summary = _worker_converter.convert_pdf(pdf_path=pdf_path, output_path=output_path, page_title=page_title)
+    return summary
+
+
+@functools.lru_cache(maxsize=2)
+def _detect_available_device(prefer_gpu: bool) -> str:
+    """Detect the best available device for processing
+
+    Cached because querying CUDA is slow and the answer doesn't change within a process.
+
+    Args:
+        prefer_gpu: Whether GPU acceleration is wanted
+
+    Returns:
+        Device string: 'cuda' (NVIDIA, or AMD on ROCm builds of PyTorch) or 'mps' (Apple Silicon)
+        if a GPU is available and preferred, otherwise 'cpu'
+    """
+    if not prefer_gpu:
+        logger.info("GPU acceleration disabled by user preference")
+        return "cpu"
+
+    try:
+        import torch  # type: ignore
+    except ImportError:
+        logger.info("PyTorch not available, falling back to CPU")
+        return "cpu"
+
+    if torch.cuda.is_available():
+        device_count = torch.cuda.device_count()
+        device_name = torch.cuda.get_device_name(0) if device_count > 0 else "Unknown"
+        logger.info(f"🚀 GPU acceleration enabled: {device_name} ({device_count} device(s) available)")
+        return "cuda"
+
+    mps_backend = getattr(torch.backends, "mps", None)
+    if mps_backend is not None and mps_backend.is_available():
+        logger.info("🚀 GPU acceleration enabled: Apple Silicon (MPS)")
+        return "mps"
+
+    logger.info("No CUDA or MPS device available, falling back to CPU")
+    return "cpu"
+
+
+@functools.lru_cache(maxsize=1)
+def _load_model_dict(device: str) -> Dict[str, Any]:
+    """Load Marker's models for a device
+
+    Cached so every converter in the process shares one copy of the models instead of
+    loading them again; TORCH_DEVICE must already be set to the same device.
+
+    Args:
+        device: Device the models are loaded on ('cuda' or 'cpu')
+
+    Returns:
+        Marker artifact dict for PdfConverter
+    """
+    from marker.models import create_model_dict
+
+    return create_model_dict()
+
+
 class PDFToMarkdownConverter:
     """PDF conversion utility with comprehensive image management and Confluence integration"""
 
@@ -74,47 +162,36 @@ class PDFToMarkdownConverter:
         """Detect the best available device for processing
 
         Returns:
-            Device string: 'cuda' if GPU available and preferred, otherwise 'cpu'
+            Device string: 'cuda' or 'mps' if a GPU is available and preferred, otherwise 'cpu'
         """
-        if not self.prefer_gpu:
-            logger.info("GPU acceleration disabled by user preference")
-            return "cpu"
-
-        if not TORCH_AVAILABLE:
-            logger.info("PyTorch not available, falling back to CPU")
-            return "cpu"
-
-        if torch.cuda.is_available():
-            device_count = torch.cuda.device_count()
-            device_name = torch.cuda.get_device_name(0) if device_count > 0 else "Unknown"
-            logger.info(f"🚀 GPU acceleration enabled: {device_name} ({device_count} device(s) available)")
-            return "cuda"
-        else:
-            logger.info("CUDA not available, falling back to CPU")
-            return "cpu"
+        return _detect_available_device(self.prefer_gpu)
 
     def _load_converter(self):
         """Load Marker converter lazily with device configuration"""
         if self.converter is None:
+            # marker (and the torch it pulls in) takes seconds to import, so it is imported on first
+            # use; CLI commands that never convert a PDF don't pay for it
+            from marker.converters.pdf import PdfConverter
+
             # Set PyTorch device for Marker
             os.environ["TORCH_DEVICE"] = self.device
             logger.info(f"Loading Marker converter and models on device: {self.device}")
 
             try:
                 self.converter = PdfConverter(
-                    artifact_dict=create_model_dict(),
+                    artifact_dict=_load_model_dict(self.device),
                 )
                 logger.info(f"✅ Converter loaded successfully on {self.device}")
             except Exception as e:
-                if self.device == "cuda":
-                    logger.warning(f"Failed to load on GPU: {e}")
+                if self.device != "cpu":
+                    logger.warning(f"Failed to load on GPU ({self.device}): {e}")
                     logger.info("Attempting fallback to CPU...")
                     # Force CPU fallback
                     self.device = "cpu"
                     os.environ["TORCH_DEVICE"] = "cpu"
                     try:
                         self.converter = PdfConverter(
-                            artifact_dict=create_model_dict(),
+                            artifact_dict=_load_model_dict("cpu"),
                         )
                         logger.info("✅ Converter loaded successfully on CPU (fallback)")
                     except Exception as cpu_error:
@@ -149,11 +226,8 @@ class PDFToMarkdownConverter:
                 logger.warning(f"Failed to format code block: {e}")
                 return match.group(0)  # Return original if formatting fails
 
-        # Pattern to match code blocks: ```optional_language\ncontent\n```
-        code_block_pattern = r"```(\w+)?\n(.*?)```"
-
         # Apply formatting to all code blocks
-        formatted_content = re.sub(code_block_pattern, format_code_block_match, markdown_content, flags=re.DOTALL)
+        formatted_content = _CODE_BLOCK_RE.sub(format_code_block_match, markdown_content)
 
         return formatted_content
 
@@ -193,6 +267,8 @@ class PDFToMarkdownConverter:
             self._load_converter()
 
             # Convert using Marker
+            from marker.output import text_from_rendered
+
             assert self.converter is not None, "Converter not initialized"
             rendered = self.converter(str(pdf_path))
             full_text, _, images = text_from_rendered(rendered)
@@ -214,8 +290,7 @@ class PDFToMarkdownConverter:
                 output_path = Path(output_path)
                 output_path.parent.mkdir(parents=True, exist_ok=True)
 
-                with open(output_path, "w", encoding="utf-8") as f:
-                    f.write(full_text)
+                output_path.write_text(full_text, encoding="utf-8")
                 logger.info(f"Markdown saved to: {output_path}")
 
             # Generate simple summary
@@ -234,7 +309,11 @@ class PDFToMarkdownConverter:
             raise PDFConversionError(error_msg) from e
 
     def batch_convert(
-        self, pdf_list: List[Union[str, Path]], output_dir: Union[str, Path], page_titles: Optional[List[str]] = None
+        self,
+        pdf_list: List[Union[str, Path]],
+        output_dir: Union[str, Path],
+        page_titles: Optional[List[str]] = None,
+        max_workers: int = 1,
     ) -> Dict[str, Any]:
         """Convert multiple PDFs to markdown
 
@@ -242,6 +321,9 @@ class PDFToMarkdownConverter:
             pdf_list: List of PDF file paths
             output_dir: Directory to save converted files
             page_titles: Optional list of page titles (must match pdf_list length)
+            max_workers: Number of worker processes converting PDFs concurrently when running on CPU
+                (capped at the CPU count). Each worker loads its own copy of the Marker models, so
+                memory use grows with the worker count. GPU batches are always converted serially.
 
         Returns:
             Dictionary with conversion results
@@ -249,52 +331,92 @@ class PDFToMarkdownConverter:
         output_dir = Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Initialize results structure
-        results: Dict[str, Any] = {
-            "success": [],
-            "failed": [],
-            "stats": {"total_characters": 0, "total_images_detected": 0},
-        }
-
-        for idx, pdf_path in enumerate(pdf_list):
-            try:
+        # On CPU, PDFs can be converted in parallel processes; results are still collected in list order
+        executor: Optional[ProcessPoolExecutor] = None
+        futures: List[Future] = []
+        workers = min(max_workers, os.cpu_count() or 1, len(pdf_list))
+        if workers > 1 and self.device == "cpu":
+            logger.info(f"Converting {len(pdf_list)} PDFs with {workers} worker processes")
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self.preserve_indentation, self.min_cleanup),
+            )
+            for idx, pdf_path in enumerate(pdf_list):
                 pdf_path = Path(pdf_path)
-                output_file = output_dir / f"{pdf_path.stem}.md"
-
-                # Get page title if provided
-                page_title = None
-                if page_titles and idx < len(page_titles):
-                    page_title = page_titles[idx]
-
-                # Convert PDF to markdown
-                markdown_content, conversion_summary = self.convert_pdf(
-                    pdf_path=pdf_path, output_path=output_file, page_title=page_title
+                page_title = page_titles[idx] if page_titles and idx < len(page_titles) else None
+                futures.append(
+                    executor.submit(_convert_in_worker, pdf_path, output_dir / f"{pdf_path.stem}.md", page_title)
                 )
 
-                results["success"].append(
-                    {
-                        "pdf_path": str(pdf_path),
-                        "output_path": str(output_file),
-                        "page_title": page_title or pdf_path.stem,
-                        "summary": conversion_summary,
-                    }
-                )
+        # Initialize results structure
+        succeeded: List[Dict[str, Any]] = []
+        failed: List[Dict[str, str]] = []
+        total_characters = 0
+        total_images_detected = 0
 
-                # Aggregate statistics
-                results["stats"]["total_characters"] += conversion_summary.get("characters_converted", 0)
-                results["stats"]["total_images_detected"] += conversion_summary.get("images_detected", 0)
+        try:
+            for idx, pdf_path in enumerate(pdf_list):
+                try:
+                    pdf_path = Path(pdf_path)
+                    output_file = output_dir / f"{pdf_path.stem}.md"
+
+                    # Get page title if provided
+                    page_title = None
+                    if page_titles and idx < len(page_titles):
+                        page_title = page_titles[idx]
+
+                    # Convert PDF to markdown
+                    conversion_summary: Optional[Dict[str, Any]] = None
+                    if executor is not None:
+                        try:
+                            conversion_summary = futures[idx].result()
+                        except BrokenProcessPool as e:
+                            # A worker died (e.g. killed for running out of memory while loading the models) and
+                            # the pool can't run anything else; convert this and the remaining PDFs serially
+                            logger.warning(f"Worker process pool failed ({e}), converting the remaining PDFs serially")
+                            executor.shutdown(cancel_futures=True)
+                            executor = None
+                        except PDFConversionError:
+                            raise
+                        except Exception as e:
+                            raise PDFConversionError(f"Worker failed to convert {pdf_path}: {e}") from e
+
+                    if conversion_summary is None:
+                        _, conversion_summary = self.convert_pdf(
+                            pdf_path=pdf_path, output_path=output_file, page_title=page_title
+                        )
 
-            except PDFConversionError as e:
-                logger.error(f"Failed to convert {pdf_path}: {e}")
-                results["failed"].append({"pdf_path": str(pdf_path), "error": str(e)})
+                    succeeded.append(
+                        {
+                            "pdf_path": str(pdf_path),
+                            "output_path": str(output_file),
+                            "page_title": page_title or pdf_path.stem,
+                            "summary": conversion_summary,
+                        }
+                    )
+
+                    # Aggregate statistics
+                    total_characters += conversion_summary.get("characters_converted", 0)
+                    total_images_detected += conversion_summary.get("images_detected", 0)
+
+                except PDFConversionError as e:
+                    logger.error(f"Failed to convert {pdf_path}: {e}")
+                    failed.append({"pdf_path": str(pdf_path), "error": str(e)})
+        finally:
+            if executor is not None:
+                executor.shutdown(cancel_futures=True)
 
-        # Log results
-        total_success = len(results["success"])
-        total_failed = len(results["failed"])
+        results: Dict[str, Any] = {
+            "success": succeeded,
+            "failed": failed,
+            "stats": {"total_characters": total_characters, "total_images_detected": total_images_detected},
+        }
 
-        logger.info(f"Batch conversion completed: Success: {total_success}, Failed: {total_failed}")
-        logger.info(f"  Total characters converted: {results['stats']['total_characters']}")
-        logger.info(f"  Total images detected: {results['stats']['total_images_detected']}")
+        # Log results
+        logger.info(f"Batch conversion completed: Success: {len(succeeded)}, Failed: {len(failed)}")
+        logger.info(f"  Total characters converted: {total_characters}")
+        logger.info(f"  Total images detected: {total_images_detected}")
 
         return results
 
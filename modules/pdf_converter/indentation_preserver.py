@@ -4,6 +4,7 @@ Preserves original PDF text indentation instead of applying standardized formatt
 """
 
 import logging
+from collections import Counter
 from typing import Any, Dict, Optional, Tuple
 
 logger = logging.getLogger(__name__)
@@ -12,6 +13,8 @@ logger = logging.getLogger(__name__)
 class IndentationPreserver:
     """Preserves original PDF text indentation patterns while providing minimal cleanup"""
 
+    __slots__ = ("min_cleanup",)
+
     def __init__(self, min_cleanup: bool = True):
         """Initialize the indentation preserver
 
@@ -39,29 +42,27 @@ class IndentationPreserver:
             "indented_lines": 0,
         }
 
-        indent_sizes = []
+        size_counts: Counter = Counter()
 
         for line in lines:
-            if not line.strip():  # Skip empty lines
-                continue
-
             # Count leading whitespace
             leading_whitespace = len(line) - len(line.lstrip())
+            if leading_whitespace == len(line):  # Skip empty lines
+                continue
+
             if leading_whitespace > 0:
                 indentation_info["indented_lines"] += 1
-                indent_sizes.append(leading_whitespace)
+                size_counts[leading_whitespace] += 1
 
                 # Check for tabs vs spaces
-                if line.startswith("\t"):
+                first_char = line[0]
+                if first_char == "\t":
                     indentation_info["uses_tabs"] = True
-                elif line.startswith(" "):
+                elif first_char == " ":
                     indentation_info["uses_spaces"] = True
 
         # Determine most common indentation sizes
-        if indent_sizes:
-            from collections import Counter
-
-            size_counts = Counter(indent_sizes)
+        if size_counts:
             indentation_info["common_indent_sizes"] = [size for size, count in size_counts.most_common(3)]
 
         # Check for mixed indentation
@@ -82,37 +83,27 @@ class IndentationPreserver:
         if not content.strip():
             return content, language_hint or "text"
 
-        lines = content.split("\n")
-        preserved_lines = []
-
-        # Analyze indentation pattern
-        indent_info = self.analyze_indentation_pattern(content)
-        logger.debug(f"Indentation analysis: {indent_info}")
+        # Analyze indentation pattern; the result is only logged, so skip the pass unless debugging
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Indentation analysis: %s", self.analyze_indentation_pattern(content))
 
         # Preserve each line's original indentation with MAXIMUM fidelity
-        for line in lines:
-            if self.min_cleanup:
-                # Only remove trailing whitespace, preserve ALL leading whitespace exactly
-                if not line.strip():
-                    # Preserve empty lines as truly empty (but don't mess with leading spaces on empty lines from PDF)
-                    preserved_lines.append("")
-                else:
-                    # Preserve ALL leading whitespace exactly as it appears in PDF
-                    # Only strip trailing whitespace to avoid line ending issues
-                    preserved_line = line.rstrip()
-                    preserved_lines.append(preserved_line)
-            else:
-                # Preserve everything exactly as-is, including trailing spaces
-                preserved_lines.append(line)
-
-        preserved_content = "\n".join(preserved_lines)
+        if self.min_cleanup:
+            # Only remove trailing whitespace, preserve ALL leading whitespace exactly;
+            # rstrip() also leaves whitespace-only lines truly empty
+            preserved_content = "\n".join([line.rstrip() for line in content.split("\n")])
+        else:
+            # Preserve everything exactly as-is, including trailing spaces
+            preserved_content = content
 
         # Optional: Try to detect language if not provided
         if not language_hint:
             language_hint = self._simple_language_detection(preserved_content)
 
         logger.debug(
-            f"Preserved indentation with maximum fidelity for {len(lines)} lines, detected language: {language_hint}"
+            "Preserved indentation with maximum fidelity for %d lines, detected language: %s",
+            content.count("\n") + 1,
+            language_hint,
         )
         return preserved_content, language_hint
 
@@ -125,16 +116,18 @@ class IndentationPreserver:
         Returns:
             Detected language string
         """
-        content_lower = content.lower()
-
         # Quick detection patterns that don't rely on indentation
-        if content.startswith("#!/bin/bash") or content.startswith("#!/bin/sh"):
+        if content.startswith(("#!/bin/bash", "#!/bin/sh")):
             return "bash"
-        elif content.strip().startswith("{") and content.strip().endswith("}"):
+
+        stripped = content.strip()
+        if stripped.startswith("{") and stripped.endswith("}"):
             return "json"
-        elif content.strip().startswith("[") and content.strip().endswith("]"):
+        elif stripped.startswith("[") and stripped.endswith("]"):
             return "json"
-        elif "echo " in content_lower or "if [" in content_lower or "$(" in content:
+
+        content_lower = content.lower()
+        if "echo " in content_lower or "if [" in content_lower or "$(" in content:
             return "bash"
         elif "---" in content or "apiVersion:" in content or "kind:" in content:
             return "yaml"
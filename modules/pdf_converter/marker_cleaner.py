@@ -5,14 +5,54 @@ Fixes common formatting issues introduced by Marker during PDF extraction
 
 import logging
 import re
-from typing import List
+from typing import List, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Patterns applied to the whole document, compiled once at import. Both start with a literal so the
+# regex engine can skip ahead to candidates instead of trying a match at every position.
+# ```yaml / ```yml opening fences and bare ``` closing fences; the caller checks that only
+# whitespace precedes the backticks on their line
+_YAML_FENCE_RE = re.compile(r"```(?:(?P<yaml>ya?ml)[^\n]*|[^\S\n]*$)", re.MULTILINE)
+# Lines with a single-space indented YAML property (" timeout: 8m" included) or machine.openshift.io label
+_YAML_LIKE_LINE_RE = re.compile(r"\n(?P<line> (?:[a-zA-Z_][a-zA-Z0-9_./-]*[^\S\n]*:|machine\.openshift\.io/)[^\n]*)")
+# Every rewrite _fix_yaml_line knows, as one alternation tried in priority order so a line is
+# scanned once; match.lastgroup names the branch that matched. " timeout: 8m" style list
+# continuations are already caught by the single-space property branch.
+_FIX_YAML_LINE_RE = re.compile(
+    r"(?P<list_item> -\s+(?P<list_rest>.*))$"  # " - status: value"
+    r"|(?P<single_space> (?P<single_space_rest>(?P<single_space_key>[a-zA-Z_][a-zA-Z0-9_./-]*)"
+    r"\s*:.*))$"  # " property: value"
+    r"|(?P<yaml_property>(?P<property_lead>\s*)-\s+(?P<property_name>[a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*"
+    r"(?P<property_value>.*))$"  # "- key: value"
+    r"|(?P<double_dash>(?P<double_dash_lead>\s*)-\s+-\s+(?P<double_dash_rest>.*))$"  # "- - key: value"
+    r"|(?P<continuation>(?P<continuation_lead>\s*)-\s+(?P<continuation_value>[^:]+))$"  # "- someValue"
+)
+
+# Correct indentation of the known properties, by their place in the YAML hierarchy
+_PROPERTY_INDENTS = {
+    # metadata properties -> 2 spaces
+    "name": "  ",
+    "namespace": "  ",
+    # spec properties -> 2 spaces
+    "maxUnhealthy": "  ",
+    "nodeStartupTimeout": "  ",
+    "selector": "  ",
+    "unhealthyConditions": "  ",
+    # nested under selector -> 4 spaces
+    "matchLabels": "    ",
+    # These are continuation lines under list items in unhealthyConditions
+    # They should align with the list item content (3 spaces after '- ')
+    "timeout": "    ",
+    "type": "    ",
+}
+
 
 class MarkerOutputCleaner:
     """Cleans up common formatting issues from Marker PDF extraction"""
 
+    __slots__ = ()
+
     def __init__(self):
         """Initialize the cleaner"""
         pass
@@ -32,74 +72,10 @@ class MarkerOutputCleaner:
         if not content:
             return content
 
-        lines = content.split("\n")
-        cleaned_lines = []
-        in_yaml_block = False
-        yaml_block_lines: List[str] = []
-        yaml_blocks_found = 0
-        yaml_lines_processed = 0
-
-        for line_num, line in enumerate(lines):
-            # Check if we're entering or exiting a YAML code block
-            if line.strip().startswith("```yaml") or line.strip().startswith("```yml"):
-                in_yaml_block = True
-                yaml_blocks_found += 1
-                cleaned_lines.append(line)
-                logger.debug(f"Found YAML block start at line {line_num}: {line.strip()}")
-                continue
-            elif line.strip() == "```" and in_yaml_block:
-                # Process the accumulated YAML block
-                if yaml_block_lines:
-                    logger.debug(f"Processing YAML block with {len(yaml_block_lines)} lines")
-                    cleaned_yaml = self._clean_yaml_block_content(yaml_block_lines)
-                    cleaned_lines.extend(cleaned_yaml)
-                    yaml_lines_processed += len(yaml_block_lines)
-                    yaml_block_lines = []
-                in_yaml_block = False
-                cleaned_lines.append(line)
-                logger.debug(f"YAML block end at line {line_num}")
-                continue
-
-            if in_yaml_block:
-                # Accumulate YAML lines for processing
-                yaml_block_lines.append(line)
-            else:
-                # Regular content, pass through unchanged
-                cleaned_lines.append(line)
-
-        # Handle case where YAML block doesn't have closing ```
-        if yaml_block_lines:
-            logger.debug(f"Processing final YAML block with {len(yaml_block_lines)} lines")
-            cleaned_yaml = self._clean_yaml_block_content(yaml_block_lines)
-            cleaned_lines.extend(cleaned_yaml)
-            yaml_lines_processed += len(yaml_block_lines)
-
-        result = "\n".join(cleaned_lines)
-        logger.info(f"YAML Cleaner: Found {yaml_blocks_found} YAML blocks, processed {yaml_lines_processed} lines")
-        return result
-
-    def _clean_yaml_block_content(self, yaml_lines: List[str]) -> List[str]:
-        """Clean YAML content that was corrupted by Marker
-
-        Args:
-            yaml_lines: List of YAML lines with potential corruption
-
-        Returns:
-            List of cleaned YAML lines
-        """
-        if not yaml_lines:
-            return yaml_lines
-
-        cleaned_lines = []
-
-        for line in yaml_lines:
-            cleaned_line = self._fix_yaml_line(line)
-            cleaned_lines.append(cleaned_line)
+        return self._clean_lines(content, fix_yaml_blocks=True, fix_raw_yaml=False)
 
-        logger.debug(f"Cleaned YAML block with {len(yaml_lines)} lines")
-        return cleaned_lines
-
-    def _fix_yaml_line(self, line: str) -> str:
+    @staticmethod
+    def _fix_yaml_line(line: str) -> str:
         """Fix a single YAML line corrupted by Marker
 
         Args:
@@ -111,107 +87,62 @@ class MarkerOutputCleaner:
         if not line.strip():
             return line
 
+        match = _FIX_YAML_LINE_RE.match(line)
+        if not match:
+            return line
+        kind = match.lastgroup
+
         # NEW PATTERN: Fix incorrect indentation (1 space instead of proper YAML indentation)
         # This is the ACTUAL issue - Marker extracts with wrong spacing
 
-        # SPECIAL CASE: Handle list items that lost their dash
-        # Pattern: " - status: value" (1 space before dash)
-        list_item_pattern = r"^( )-\s+(.*)$"
-        list_match = re.match(list_item_pattern, line)
-
-        if list_match:
-            single_space, rest_of_line = list_match.groups()
+        if kind == "list_item":
+            # SPECIAL CASE: Handle list items that lost their dash
             # List items in unhealthyConditions should have 2-space indentation
-            fixed_line = f"  - {rest_of_line}"
-            logger.debug(f"Fixed YAML list item: '{line.strip()}' -> '{fixed_line.strip()}'")
+            fixed_line = f"  - {match['list_rest']}"
+            logger.debug("Fixed YAML list item: %r -> %r", line, fixed_line)
             return fixed_line
 
-        # Pattern: " property: value" (1 space) should be proper YAML indentation
-        single_space_pattern = r"^( )([a-zA-Z_][a-zA-Z0-9_./-]*\s*:.*)$"
-        match = re.match(single_space_pattern, line)
-
-        if match:
-            single_space, rest_of_line = match.groups()
+        if kind == "single_space":
+            rest_of_line = match["single_space_rest"]
 
             # Determine correct indentation based on YAML hierarchy
-            property_name = rest_of_line.split(":")[0].strip()
-
-            if property_name in ["name", "namespace"]:
-                # metadata properties -> 2 spaces
-                fixed_line = f"  {rest_of_line}"
-            elif property_name in ["maxUnhealthy", "nodeStartupTimeout", "selector", "unhealthyConditions"]:
-                # spec properties -> 2 spaces
-                fixed_line = f"  {rest_of_line}"
-            elif property_name in ["matchLabels"]:
-                # nested under selector -> 4 spaces
-                fixed_line = f"    {rest_of_line}"
-            elif property_name.startswith("machine.openshift.io/"):
-                # nested under matchLabels -> 6 spaces
-                fixed_line = f"      {rest_of_line}"
-            elif property_name in ["timeout", "type"]:
-                # These are continuation lines under list items in unhealthyConditions
-                # They should align with the list item content (3 spaces after '- ')
-                fixed_line = f"    {rest_of_line}"
-            else:
-                # Default to 2 spaces for unknown properties
-                fixed_line = f"  {rest_of_line}"
-
-            logger.debug(
-                f"Fixed YAML indentation: '{line.strip()}' -> '{fixed_line.strip()}' "
-                f"(1 space -> {len(fixed_line) - len(fixed_line.lstrip())} spaces)"
-            )
+            property_name = match["single_space_key"]
+
+            indent = _PROPERTY_INDENTS.get(property_name)
+            if indent is None:
+                if property_name.startswith("machine.openshift.io/"):
+                    # nested under matchLabels -> 6 spaces
+                    indent = "      "
+                else:
+                    # Default to 2 spaces for unknown properties
+                    indent = "  "
+            fixed_line = f"{indent}{rest_of_line}"
+
+            logger.debug("Fixed YAML indentation: %r -> %r (1 space -> %d spaces)", line, fixed_line, len(indent))
             return fixed_line
 
         # LEGACY PATTERNS (keep for backward compatibility)
 
-        # Pattern: "- key: value" where it should be "  key: value"
-        # This handles cases where Marker added dashes to indented YAML properties
-        yaml_property_pattern = r"^(\s*)-\s+([a-zA-Z_][a-zA-Z0-9_]*)\s*:\s*(.*)$"
-        match = re.match(yaml_property_pattern, line)
-
-        if match:
-            leading_spaces, property_name, property_value = match.groups()
+        if kind == "yaml_property":
             # Replace the dash with 2 additional spaces to maintain YAML indentation
-            fixed_line = f"{leading_spaces}  {property_name}: {property_value}"
-            logger.debug(f"Fixed YAML property: '{line.strip()}' -> '{fixed_line.strip()}'")
+            fixed_line = f"{match['property_lead']}  {match['property_name']}: {match['property_value']}"
+            logger.debug("Fixed YAML property: %r -> %r", line, fixed_line)
             return fixed_line
 
-        # Pattern: "- - key: value" (double dash corruption)
-        double_dash_pattern = r"^(\s*)-\s+-\s+(.*)$"
-        match = re.match(double_dash_pattern, line)
-
-        if match:
-            leading_spaces, rest_of_line = match.groups()
+        if kind == "double_dash":
             # This is likely a list item that got double-corrupted
-            fixed_line = f"{leading_spaces}  - {rest_of_line}"
-            logger.debug(f"Fixed double-dash corruption: '{line.strip()}' -> '{fixed_line.strip()}'")
+            fixed_line = f"{match['double_dash_lead']}  - {match['double_dash_rest']}"
+            logger.debug("Fixed double-dash corruption: %r -> %r", line, fixed_line)
             return fixed_line
 
-        # SPECIAL CASE: Handle list item continuation lines that got corrupted
-        # Pattern: " timeout: 8m" or " type: Ready" after a list item
-        list_continuation_pattern = r"^( )(timeout|type):\s*(.*)$"
-        match = re.match(list_continuation_pattern, line)
-
-        if match:
-            single_space, property_name, property_value = match.groups()
-            # These should align with the list item content (4 spaces total)
-            fixed_line = f"    {property_name}: {property_value}"
-            logger.debug(f"Fixed list continuation: '{line.strip()}' -> '{fixed_line.strip()}'")
+        # Only the continuation branch is left
+        continuation_value = match["continuation_value"]
+        # Check if this looks like a continuation value (no colon, not a typical list item)
+        if not continuation_value.strip().startswith(("-", "*", "status:", "timeout:", "type:")):
+            fixed_line = f"{match['continuation_lead']}    {continuation_value}"
+            logger.debug("Fixed continuation line: %r -> %r", line, fixed_line)
             return fixed_line
 
-        # Pattern: "- someValue" where it should be "    someValue" (continuation line)
-        continuation_pattern = r"^(\s*)-\s+([^:]+)$"
-        match = re.match(continuation_pattern, line)
-
-        if match:
-            leading_spaces, continuation_value = match.groups()
-            # Check if this looks like a continuation value (no colon, not a typical list item)
-            if not continuation_value.strip().startswith(("-", "*", "status:", "timeout:", "type:")):
-                fixed_line = f"{leading_spaces}    {continuation_value}"
-                logger.debug(f"Fixed continuation line: '{line.strip()}' -> '{fixed_line.strip()}'")
-                return fixed_line
-
-        # Return unchanged if no patterns match
         return line
 
     def clean_marker_output(self, content: str) -> str:
@@ -226,13 +157,9 @@ class MarkerOutputCleaner:
         if not content:
             return content
 
-        # Clean YAML structure issues in code blocks
-        content = self.clean_yaml_structure(content)
-
-        # ALSO clean raw YAML-like content that's not in code blocks
-        content = self.clean_raw_yaml_indentation(content)
-
-        return content
+        # Clean YAML structure issues in code blocks, and ALSO raw YAML-like content that's
+        # not in code blocks, in a single pass over the content
+        return self._clean_lines(content, fix_yaml_blocks=True, fix_raw_yaml=True)
 
     def clean_raw_yaml_indentation(self, content: str) -> str:
         """Fix YAML indentation in raw text (not in code blocks)
@@ -246,57 +173,121 @@ class MarkerOutputCleaner:
         Returns:
             Content with YAML indentation fixed
         """
-        lines = content.split("\n")
-        cleaned_lines = []
-        yaml_fixes_applied = 0
-
-        # Look for YAML patterns in the raw text
-        for line_num, line in enumerate(lines):
-            original_line = line
-
-            # Check if this line looks like YAML with wrong indentation
-            if self._is_yaml_like_line(line):
-                # Apply the same fixing logic we use for code blocks
-                fixed_line = self._fix_yaml_line(line)
-                if fixed_line != original_line:
-                    yaml_fixes_applied += 1
-                    logger.debug(f"Fixed raw YAML line {line_num}: '{line.strip()}' -> '{fixed_line.strip()}'")
-                cleaned_lines.append(fixed_line)
-            else:
-                cleaned_lines.append(line)
-
-        result = "\n".join(cleaned_lines)
-        if yaml_fixes_applied > 0:
-            logger.info(f"Raw YAML Cleaner: Fixed {yaml_fixes_applied} YAML indentation issues in raw text")
+        return self._clean_lines(content, fix_yaml_blocks=False, fix_raw_yaml=True)
 
-        return result
+    def _clean_lines(self, content: str, fix_yaml_blocks: bool, fix_raw_yaml: bool) -> str:
+        """Apply the YAML block and/or raw YAML fixes in a single pass over the content
 
-    def _is_yaml_like_line(self, line: str) -> bool:
-        """Check if a line looks like YAML content with potential indentation issues
+        Fences and YAML-like lines are located with regexes over the whole document, so only
+        YAML block contents are split into lines; other text is copied through in slices.
 
         Args:
-            line: Line to check
+            content: Raw markdown content from Marker
+            fix_yaml_blocks: Fix every line inside ```yaml / ```yml code blocks
+            fix_raw_yaml: Fix YAML-like lines with wrong indentation outside those blocks
 
         Returns:
-            True if this looks like a YAML line that might need fixing
+            Cleaned content
         """
-        if not line.strip():
-            return False
+        # Most documents have no YAML blocks at all; skip the fence scan for them
+        look_for_fences = fix_yaml_blocks and ("```yaml" in content or "```yml" in content)
+        if fix_yaml_blocks and not look_for_fences and not fix_raw_yaml:
+            logger.info("YAML Cleaner: Found 0 YAML blocks, processed 0 lines")
+            return content
+
+        # (start, end) offsets of the lines inside each YAML block
+        block_spans: List[Tuple[int, int]] = []
+        yaml_blocks_found = 0
+        if look_for_fences:
+            block_start = -1
+            for fence in _YAML_FENCE_RE.finditer(content):
+                line_start = content.rfind("\n", 0, fence.start()) + 1
+                indent = content[line_start : fence.start()]
+                if indent and not indent.isspace():
+                    continue  # Backticks in the middle of a line
+
+                if fence["yaml"]:
+                    if block_start >= 0:
+                        # Opening fence inside an open block: the block carries on after it
+                        block_spans.append((block_start, line_start - 1))
+                    block_start = fence.end() + 1
+                    yaml_blocks_found += 1
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug(
+                            "Found YAML block start at line %d: %s",
+                            content.count("\n", 0, line_start),
+                            content[line_start : fence.end()].strip(),
+                        )
+                elif block_start >= 0:
+                    block_spans.append((block_start, line_start - 1))
+                    block_start = -1
+                    if logger.isEnabledFor(logging.DEBUG):
+                        logger.debug("YAML block end at line %d", content.count("\n", 0, line_start))
+            # Handle case where YAML block doesn't have closing ```
+            if 0 <= block_start <= len(content):
+                block_spans.append((block_start, len(content)))
+
+        pieces = []
+        copied = 0
+        yaml_lines_processed = 0
+        yaml_fixes_applied = 0
+        fix_yaml_line = self._fix_yaml_line
+
+        for start, end in block_spans:
+            if end < start:  # Fences on consecutive lines, nothing in between
+                continue
+            raw_text = content[copied:start]
+            if fix_raw_yaml:
+                raw_text, fixes = self._fix_raw_yaml_lines(raw_text)
+                yaml_fixes_applied += fixes
+            pieces.append(raw_text)
+
+            # Fixed block lines are never YAML-like again, so the raw fix can't apply to them
+            yaml_lines = content[start:end].split("\n")
+            pieces.append("\n".join([fix_yaml_line(line) for line in yaml_lines]))
+            yaml_lines_processed += len(yaml_lines)
+            copied = end
+
+        raw_text = content[copied:]
+        if fix_raw_yaml:
+            raw_text, fixes = self._fix_raw_yaml_lines(raw_text)
+            yaml_fixes_applied += fixes
+        pieces.append(raw_text)
+
+        if fix_yaml_blocks:
+            logger.info(f"YAML Cleaner: Found {yaml_blocks_found} YAML blocks, processed {yaml_lines_processed} lines")
+        if yaml_fixes_applied > 0:
+            logger.info(f"Raw YAML Cleaner: Fixed {yaml_fixes_applied} YAML indentation issues in raw text")
 
-        # Look for lines that match our YAML patterns
-        # Check for single-space indented YAML properties
-        if re.match(r"^( )([a-zA-Z_][a-zA-Z0-9_./-]*\s*:.*)$", line):
-            return True
+        return "".join(pieces)
 
-        # Check for machine.openshift.io properties
-        if re.match(r"^( )(machine\.openshift\.io/.*)$", line):
-            return True
+    def _fix_raw_yaml_lines(self, text: str) -> Tuple[str, int]:
+        """Fix the YAML-like lines with wrong indentation in a stretch of raw text
 
-        # Check for list continuation patterns
-        if re.match(r"^( )(timeout|type):\s*(.*)$", line):
-            return True
+        Args:
+            text: Content outside YAML blocks
 
-        return False
+        Returns:
+            Tuple of (fixed_text, number_of_lines_fixed)
+        """
+        # The pattern anchors on the newline before each line, so give the first line one too
+        padded = "\n" + text
+        pieces = []
+        copied = 1
+        for match in _YAML_LIKE_LINE_RE.finditer(padded):
+            line = match["line"]
+            # Apply the same fixing logic we use for code blocks
+            fixed_line = self._fix_yaml_line(line)
+            if fixed_line != line:
+                logger.debug("Fixed raw YAML line: %r -> %r", line, fixed_line)
+                pieces.append(padded[copied : match.start("line")])
+                pieces.append(fixed_line)
+                copied = match.end()
+
+        if not pieces:
+            return text, 0
+        pieces.append(padded[copied:])
+        return "".join(pieces), len(pieces) // 2
 
 
 def main():